@@ -0,0 +1,75 @@
+# infra_cc/console.py
+# Purpose:
+#   Spinner-aware output for every infra_cc module.
+#   - sp_print / sp_write behave like print() / sys.stdout.write() by default.
+#   - An orchestrator that draws its own status line (full_setup's spinner) installs a hook
+#     so module output is ordered with its frames.
+#
+# Notes:
+#   - Nothing patches sys.stdout: third-party output (boto logs, tracebacks) is untouched
+#     and never pays for the spinner.
+#   - queued_output() gives thread pools (parallel deleters) one writer thread, so workers
+#     hand off lines instead of contending on stdout.
+
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+# hook(text) -> True if it took the text, False to fall through to sys.stdout
+_hook: Optional[Callable[[str], bool]] = None
+
+
+def set_hook(fn: Optional[Callable[[str], bool]]) -> Optional[Callable[[str], bool]]:
+    """Install (or with None, remove) the output hook; returns the previous one."""
+    global _hook
+    prev, _hook = _hook, fn
+    return prev
+
+
+def sp_write(text: str, flush: bool = False) -> None:
+    """sys.stdout.write() that goes through the hook when one is installed."""
+    hook = _hook
+    if hook is not None and hook(text):
+        return
+    sys.stdout.write(text)
+    if flush:
+        sys.stdout.flush()
+
+
+def sp_print(*args, sep: str = " ", end: str = "\n", flush: bool = False) -> None:
+    """print() for infra_cc modules (stdout only)."""
+    sp_write(sep.join(map(str, args)) + end, flush=flush)
+
+
+@contextmanager
+def queued_output() -> Iterator[None]:
+    """
+    For the duration, sp_write only enqueues; one writer thread does the stdout writes
+    (flushing whenever it catches up). A no-op if a hook (e.g. full_setup's spinner
+    writer, already queue-backed) is installed. Everything queued is written before exit.
+    """
+    if _hook is not None:
+        yield
+        return
+    q: queue.SimpleQueue = queue.SimpleQueue()
+
+    def _drain() -> None:
+        while (text := q.get()) is not None:
+            sys.stdout.write(text)
+            if q.empty():
+                sys.stdout.flush()
+        sys.stdout.flush()
+
+    writer = threading.Thread(target=_drain, name="console-writer", daemon=True)
+    writer.start()
+    prev = set_hook(lambda text: q.put(text) or True)
+    try:
+        yield
+    finally:
+        set_hook(prev)
+        q.put(None)
+        writer.join()
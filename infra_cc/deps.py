@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 # infra_cc/deps.py
 # Dependency framework: register checkers/deleters, build/print tree, delete in safe order.
-# This version NEVER prompts; it always proceeds (post-order) once called.
+# Single source of truth for the pipeline: it NEVER prompts and always proceeds (post-order) once called.
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+import contextvars
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-@dataclass
+from .console import queued_output, sp_print, sp_write
+
+# Checkers are I/O-bound (boto3 describe_*), so sibling expansions run on a small pool.
+DEFAULT_MAX_WORKERS = 16
+
+@dataclass(slots=True)
 class Blocker:
     kind: str                 # e.g., "vpc", "subnet", "internet-gateway", "nat-gateway", "eni"
     id: str
     name: Optional[str] = None
     reason: Optional[str] = None
     children: List["Blocker"] = field(default_factory=list)
+    meta: Dict[str, Any] = field(default_factory=dict)  # facts the checker already read (handed to the deleter)
 
 class DeleteBlocked(Exception):
     def __init__(self, root: Blocker, msg: str = "delete blocked by dependencies"):
@@ -22,110 +31,311 @@ class DeleteBlocked(Exception):
 
 # Registries
 _CHECKERS: Dict[str, Callable[[str], List[Blocker]]] = {}
-_DELETERS: Dict[str, Callable[[str], None]] = {}
+_DELETERS: Dict[str, Callable[[str, Dict[str, Any]], None]] = {}
+_BULK_DELETERS: Dict[str, Callable[[List[str]], None]] = {}
 
 # ---- Registration decorators ----
+def _register(registry: Dict[str, Callable], kind: str, fn: Callable, what: str) -> None:
+    """
+    One implementation per kind. Re-running the same definition is fine (a module executed
+    both as __main__ and as infra_cc.<mod> registers twice); a different one is an error,
+    since otherwise whichever module imported last would silently win.
+    """
+    prev = registry.get(kind)
+    if prev is not None and (prev.__qualname__, prev.__code__.co_filename) != (fn.__qualname__, fn.__code__.co_filename):
+        raise ValueError(f"{what} for kind '{kind}' already registered by "
+                         f"{prev.__module__}.{prev.__qualname__}; refusing {fn.__module__}.{fn.__qualname__}")
+    registry[kind] = fn
+
 def register_checker(kind: str):
     def deco(fn: Callable[[str], List[Blocker]]):
-        _CHECKERS[kind] = fn
+        _register(_CHECKERS, kind, fn, "checker")
         return fn
     return deco
 
 def register_deleter(kind: str):
-    def deco(fn: Callable[[str], None]):
-        _DELETERS[kind] = fn
+    """Deleters are called as fn(rid, meta) with the node's `meta` dict (may be empty)."""
+    def deco(fn: Callable[[str, Dict[str, Any]], None]):
+        _register(_DELETERS, kind, fn, "deleter")
         return fn
     return deco
 
-# ---- Auto-load all infra_cc.* modules once so their registrations apply ----
-_PLUGINS_LOADED = False
-def _ensure_plugins_loaded_once():
-    global _PLUGINS_LOADED
-    if _PLUGINS_LOADED:
-        return
-    try:
-        import pkgutil, importlib
-        from . import __path__ as pkg_path, __name__ as pkg_name
-        for m in pkgutil.iter_modules(pkg_path):
-            name = m.name
-            # Skip private helpers and ourselves
-            if name.startswith("_") or name in ("deps",):
-                continue
-            importlib.import_module(f"{pkg_name}.{name}")
-    finally:
-        _PLUGINS_LOADED = True
+def register_bulk_deleter(kind: str):
+    """
+    Optional: fn(ids) deletes several nodes of `kind` from one deletion layer in one go.
+    Used when a layer holds two or more of that kind; the per-id deleter is still required.
+    """
+    def deco(fn: Callable[[List[str]], None]):
+        _register(_BULK_DELETERS, kind, fn, "bulk deleter")
+        return fn
+    return deco
+
+# ---- Lazy plugin loading: import only the module that registers a given kind ----
+# Kinds without an entry (e.g. "eni") have no checker/deleter module.
+_KIND_TO_MODULE: Dict[str, str] = {
+    "vpc":              "vpc",
+    "security-group":   "vpc",
+    "subnet":           "subnet",
+    "internet-gateway": "igw",
+    "nat-gateway":      "natgw",
+}
+
+def _load_kind(kind: str) -> None:
+    mod = _KIND_TO_MODULE.get(kind)
+    if mod:
+        importlib.import_module(f"{__package__}.{mod}")
+
+# ---- Per-build snapshot: describes prefetched by the caller, readable from every checker ----
+# Lives here (not in the caller's module) so a module run as __main__ and its imported twin
+# share it. build_tree sets it for the build; _expand_recursive runs each checker in a copy
+# of the context, so the pool threads see it too. None means "no snapshot: describe as usual".
+_SNAPSHOT: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("deps_snapshot", default=None)
+
+def current_snapshot() -> Optional[Dict[str, Any]]:
+    """The snapshot passed to the build_tree() in progress, or None."""
+    return _SNAPSHOT.get()
 
 # ---- Tree building / printing ----
+# Shared result for kinds without a checker; never mutated (callers only read/iterate it).
+_EMPTY: List[Blocker] = []
+
 def expand(kind: str, rid: str) -> List[Blocker]:
     fn = _CHECKERS.get(kind)
-    return fn(rid) if fn else []
+    if fn is None:
+        _load_kind(kind)
+        fn = _CHECKERS.get(kind)
+    return fn(rid) if fn is not None else _EMPTY
 
-def _expand_recursive(node: Blocker) -> None:
-    node.children = expand(node.kind, node.id)
-    for ch in node.children:
-        _expand_recursive(ch)
+def _expand_recursive(node: Blocker, max_workers: int = DEFAULT_MAX_WORKERS,
+                      memo: Optional[Dict[Tuple[str, str], List[Blocker]]] = None) -> None:
+    """
+    Expand the tree level by level: every node on the current frontier is checked
+    concurrently, then their children become the next frontier.
+    `memo` caches checker results by (kind, id) for this build only, so a resource
+    reached through several parents is described once; each parent gets its own copies.
+    """
+    if memo is None:
+        memo = {}
+    frontier = [node]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while frontier:
+            todo = list(dict.fromkeys((n.kind, n.id) for n in frontier if (n.kind, n.id) not in memo))
+            # Each check runs in a copy of the caller's context, so checkers see its
+            # ContextVars (e.g. vpc.delete()'s graph snapshot) from the pool threads
+            futs = [pool.submit(contextvars.copy_context().run, expand, *key) for key in todo]
+            for key, f in zip(todo, futs):
+                memo[key] = f.result()
+            nxt: List[Blocker] = []
+            extend = nxt.extend
+            for n in frontier:
+                n.children = [replace(b, children=[]) for b in memo[(n.kind, n.id)]]
+                extend(n.children)
+            frontier = nxt
 
-def build_tree(kind: str, rid: str, name: Optional[str] = None, reason: Optional[str] = None) -> Blocker:
-    _ensure_plugins_loaded_once()
-    root = Blocker(kind=kind, id=rid, name=name, reason=reason)
-    _expand_recursive(root)
+def build_tree(kind: str, rid: str, name: Optional[str] = None, reason: Optional[str] = None,
+               max_workers: int = DEFAULT_MAX_WORKERS, meta: Optional[Dict[str, Any]] = None,
+               snapshot: Optional[Dict[str, Any]] = None) -> Blocker:
+    root = Blocker(kind=kind, id=rid, name=name, reason=reason, meta=dict(meta or {}))
+    if kind not in _CHECKERS:
+        _load_kind(kind)
+        if kind not in _CHECKERS:
+            return root  # leaf kind: no checker, nothing to expand (skip the worker pool)
+    token = _SNAPSHOT.set(snapshot)
+    try:
+        _expand_recursive(root, max_workers=max_workers, memo={})
+    finally:
+        _SNAPSHOT.reset(token)
     return root
 
+_PADS: List[str] = [""]
+
+def _pad(depth: int) -> str:
+    while len(_PADS) <= depth:
+        _PADS.append(_PADS[-1] + "  ")
+    return _PADS[depth]
+
 def print_tree(root: Blocker, indent: int = 0) -> None:
-    pad = "  " * indent
-    meta = []
-    if root.name:
-        meta.append(f"name={root.name}")
-    if root.reason:
-        meta.append(f"reason={root.reason}")
-    extra = ("  " + "  ".join(meta)) if meta else ""
-    print(f"{pad}- {root.kind}: {root.id}{extra}")
-    for ch in root.children:
-        print_tree(ch, indent + 1)
+    """Format the whole tree into one buffer and emit it with a single write."""
+    buf: List[str] = []
+    stack = [(root, indent)]
+    while stack:
+        node, depth = stack.pop()
+        meta = []
+        if node.name:
+            meta.append(f"name={node.name}")
+        if node.reason:
+            meta.append(f"reason={node.reason}")
+        extra = ("  " + "  ".join(meta)) if meta else ""
+        buf.append(f"{_pad(depth)}- {node.kind}: {node.id}{extra}\n")
+        # Push in reverse so children print in their original order
+        stack.extend((ch, depth + 1) for ch in reversed(node.children))
+    sp_write("".join(buf))
 
 # ---- Deletion (post-order) ----
+def _postorder(node: Blocker) -> List[Blocker]:
+    """Children-before-parent ordering of the subtree at `node`, built without recursion."""
+    stack = [node]
+    out: List[Blocker] = []
+    while stack:
+        n = stack.pop()
+        out.append(n)
+        stack.extend(n.children)
+    out.reverse()
+    return out
+
 def _collect_missing_deleters(node: Blocker, missing: Optional[set] = None) -> set:
     if missing is None:
         missing = set()
-    if node.kind not in _DELETERS:
-        missing.add(node.kind)
-    for ch in node.children:
-        _collect_missing_deleters(ch, missing)
+    deleters = _DELETERS
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n.kind not in deleters:
+            _load_kind(n.kind)
+            if n.kind not in deleters:
+                missing.add(n.kind)
+        stack.extend(n.children)
     return missing
 
-def _delete_tree_postorder(node: Blocker) -> None:
-    for ch in node.children:
-        _delete_tree_postorder(ch)
-    deleter = _DELETERS.get(node.kind)
-    if not deleter:
-        raise DeleteBlocked(node, msg=f"No deleter registered for kind '{node.kind}'")
-    deleter(node.id)
+def _first_missing_deleter(node: Blocker, skip_root: bool = False) -> Optional[str]:
+    """Return the first kind in the subtree with no deleter (early exit), or None if all are covered."""
+    deleters = _DELETERS
+    stack = list(node.children) if skip_root else [node]
+    while stack:
+        n = stack.pop()
+        if n.kind not in deleters:
+            _load_kind(n.kind)
+            if n.kind not in deleters:
+                return n.kind
+        stack.extend(n.children)
+    return None
+
+# Sibling deletes are independent EC2 calls on the shared client; keep well under rate limits.
+DELETE_MAX_WORKERS = 8
+
+# Static teardown order for the kinds this repo manages: stage by stage, kinds within a stage
+# are deleted concurrently. It also encodes what the tree alone doesn't: an IGW can't be
+# detached while the NAT's EIP is still mapped, and an SG can't go while ENIs reference it.
+DELETE_ORDER: Tuple[Tuple[str, ...], ...] = (
+    ("nat-gateway", "eni"),
+    ("subnet", "internet-gateway", "security-group"),
+    ("vpc",),
+)
+_STAGE: Dict[str, int] = {kind: i for i, kinds in enumerate(DELETE_ORDER) for kind in kinds}
+
+def _layers(tops: List[Blocker]) -> List[List[Blocker]]:
+    """
+    Group the subtrees at `tops` into deletion layers; every node's children land in earlier
+    layers and a resource reached through several parents is deleted once.
+    If every kind is in DELETE_ORDER the layers are simply its stages. Otherwise layers go by
+    height (leaves = layer 0, a parent one above its tallest child), with known kinds still
+    kept behind every node of an earlier stage.
+    """
+    first: Dict[Tuple[str, str], Blocker] = {}
+    for top in tops:
+        for n in _postorder(top):
+            first.setdefault((n.kind, n.id), n)
+    if all(kind in _STAGE for kind, _ in first):
+        staged: List[List[Blocker]] = [[] for _ in DELETE_ORDER]
+        for (kind, _), n in first.items():
+            staged[_STAGE[kind]].append(n)
+        return [layer for layer in staged if layer]
+
+    # One pass: a node is settled once, after its children, as
+    # max(tallest child + 1, floor of its stage). Settling the stages in DELETE_ORDER first
+    # means every earlier-stage node is already settled when a stage's floor is read, so the
+    # running per-stage maxima are final by then and nothing needs revisiting.
+    height: Dict[Tuple[str, str], int] = {}
+    stage_max = [-1] * len(DELETE_ORDER)
+
+    def _settle(top: Blocker) -> None:
+        stack = [(top, False)]
+        while stack:
+            n, children_done = stack.pop()
+            key = (n.kind, n.id)
+            if key in height:
+                continue
+            if not children_done:
+                stack.append((n, True))
+                stack.extend((ch, False) for ch in n.children)
+                continue
+            h = 1 + max((height[(ch.kind, ch.id)] for ch in n.children), default=-1)
+            stage = _STAGE.get(n.kind)
+            if stage is not None:
+                h = max(h, 1 + max(stage_max[:stage], default=-1))
+                stage_max[stage] = max(stage_max[stage], h)
+            height[key] = h
+
+    by_stage: List[List[Blocker]] = [[] for _ in DELETE_ORDER]
+    for (kind, _), n in first.items():
+        if kind in _STAGE:
+            by_stage[_STAGE[kind]].append(n)
+    for stage_nodes in by_stage:
+        for n in stage_nodes:
+            _settle(n)
+    for top in tops:
+        _settle(top)
+    out: List[List[Blocker]] = [[] for _ in range(max(height.values(), default=-1) + 1)]
+    for key, h in height.items():
+        out[h].append(first[key])
+    return out
+
+def _delete_tree_postorder(node: Blocker, max_workers: int = DELETE_MAX_WORKERS,
+                           include_root: bool = True) -> None:
+    """
+    Delete the subtree children-first; nodes within one layer are deleted concurrently.
+    With include_root=False only the root's descendants go (all layered together).
+    """
+    deleters = _DELETERS
+
+    def _delete(n: Blocker) -> None:
+        try:
+            deleter = deleters[n.kind]
+        except KeyError:
+            raise DeleteBlocked(n, msg=f"No deleter registered for kind '{n.kind}'") from None
+        deleter(n.id, n.meta)
+
+    for layer in _layers([node] if include_root else node.children):
+        if len(layer) == 1:
+            _delete(layer[0])
+            continue
+        # Kinds with a bulk deleter get one call for all their nodes in this layer
+        by_kind: Dict[str, List[Blocker]] = {}
+        for n in layer:
+            by_kind.setdefault(n.kind, []).append(n)
+        tasks = []
+        for kind, nodes in by_kind.items():
+            bulk = _BULK_DELETERS.get(kind)
+            if bulk is not None and len(nodes) > 1:
+                tasks.append((bulk, [n.id for n in nodes]))
+            else:
+                tasks.extend((_delete, n) for n in nodes)
+        # Let the whole layer finish before surfacing a failure, so nothing is left half-started.
+        # Workers' status lines go through one writer thread instead of racing for stdout.
+        with queued_output(), ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+            futs = [pool.submit(fn, arg) for fn, arg in tasks]
+        for f in futs:
+            f.result()
 
 def prompt_and_delete(root: Blocker, delete_root: bool = True) -> None:
     """
     Print the dependency tree (if there are children) and ALWAYS delete in order.
     No prompts here — the only Y/N in the system remains the NAT warning in full_setup.
     """
-    _ensure_plugins_loaded_once()
-
     # Show dependencies if any (helps visibility)
     if root.children:
-        print("[dependencies]")
+        sp_print("[dependencies]")
         print_tree(root)
 
-    # Ensure we have deleters for everything we'll touch
-    missing = _collect_missing_deleters(root)
-    if missing:
-        # If caller asked not to delete the root, ignore missing deleter for the root itself
-        if not delete_root and root.kind in missing:
-            missing.remove(root.kind)
-        if missing:
-            kinds = ", ".join(sorted(missing))
-            raise DeleteBlocked(root, msg=f"Missing deleter(s) for kind(s): {kinds}")
-
-    # Delete children (and optionally root) post-order — NO prompt
-    if delete_root:
-        _delete_tree_postorder(root)
-    else:
-        for ch in root.children:
-            _delete_tree_postorder(ch)
+    # Ensure we have deleters for everything we'll touch.
+    # If caller asked not to delete the root, its own kind doesn't need a deleter.
+    if _first_missing_deleter(root, skip_root=not delete_root) is not None:
+        # Failure path only: walk everything once more for the full list in the message
+        missing: set = set()
+        for n in ([root] if delete_root else root.children):
+            _collect_missing_deleters(n, missing)
+        kinds = ", ".join(sorted(missing))
+        raise DeleteBlocked(root, msg=f"Missing deleter(s) for kind(s): {kinds}")
+
+    # Delete children (and optionally root) post-order, one set of layers — NO prompt
+    _delete_tree_postorder(root, include_root=delete_root)
@@ -13,11 +13,14 @@ Supports --purge on delete to remove the SG (if unused) and the key pair + local
 """
 
 from __future__ import annotations
-import argparse, os, stat
+import argparse, functools, os, stat
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from botocore.exceptions import ClientError
 
-from .session import ec2
-from .naming  import res_name, tags_for
+from .console import sp_print
+from .session import ec2, client
+from .naming  import name_tag, res_name, tags_for
 from . import vpc as vpc_mod
 
 PUBLIC_SUBNET_NAME  = res_name("subnet-outside")
@@ -34,19 +37,32 @@ SPEC_EC2PUB  = "mar5-demo-ec2-public"
 SPEC_EC2PRV  = "mar5-demo-ec2-private"
 
 INSTANCE_TYPE = "t3.micro"
+# AWS publishes the current AL2023 AMI id here; one small SSM read instead of a bulk describe_images
+AL2023_SSM_PARAM = "/aws/service/ami-amazon-linux-latest/al2023-ami-kernel-default-x86_64"
 KEY_PATH = f"./.keys/{KEY_NAME}.pem"
 
-def _find_subnet_id(name: str, cidr: str) -> str:
+def _find_subnet_ids(specs: list[tuple[str, str]], vpc_id: str | None = None) -> dict[str, str]:
+    """
+    Resolve several (name, cidr) subnets in our VPC with one describe_subnets call.
+    Returns {name: subnet_id}; aborts if any is missing or ambiguous.
+    """
     c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
+    vpc_id = vpc_id or vpc_mod.find_vpc_id()
     r = c.describe_subnets(Filters=[
         {"Name":"vpc-id","Values":[vpc_id]},
-        {"Name":"cidr-block","Values":[cidr]},
-        {"Name":"tag:Name","Values":[name]},
+        {"Name":"cidr-block","Values":[cidr for _, cidr in specs]},
     ]).get("Subnets", [])
-    if not r: raise SystemExit(f"[abort] subnet not found: {name} ({cidr})")
-    if len(r)>1: raise SystemExit(f"[abort] multiple subnets match {name} {cidr}")
-    return r[0]["SubnetId"]
+    out: dict[str, str] = {}
+    for name, cidr in specs:
+        hits = [s for s in r if s["CidrBlock"] == cidr
+                and any(t["Key"] == "Name" and t["Value"] == name for t in s.get("Tags", []))]
+        if not hits: raise SystemExit(f"[abort] subnet not found: {name} ({cidr})")
+        if len(hits)>1: raise SystemExit(f"[abort] multiple subnets match {name} {cidr}")
+        out[name] = hits[0]["SubnetId"]
+    return out
+
+def _find_subnet_id(name: str, cidr: str) -> str:
+    return _find_subnet_ids([(name, cidr)])[name]
 
 def _ensure_keypair() -> str:
     c = ec2()
@@ -63,51 +79,75 @@ def _ensure_keypair() -> str:
     with open(KEY_PATH, "w") as f:
         f.write(kp["KeyMaterial"])
     os.chmod(KEY_PATH, stat.S_IRUSR | stat.S_IWUSR)
-    print(f"[keypair] created {KEY_NAME}, saved private key to {KEY_PATH}")
+    sp_print(f"[keypair] created {KEY_NAME}, saved private key to {KEY_PATH}")
     return KEY_NAME
 
-def _ensure_sg() -> str:
+def _has_open_rule(perms: list[dict], proto: str, port: int | None = None) -> bool:
+    """True if `perms` already allows `proto` (and `port`, if given) from 0.0.0.0/0."""
+    for p in perms:
+        if p.get("IpProtocol") != proto:
+            continue
+        if port is not None and (p.get("FromPort") != port or p.get("ToPort") != port):
+            continue
+        if any(rng.get("CidrIp") == "0.0.0.0/0" for rng in p.get("IpRanges", [])):
+            return True
+    return False
+
+def _ensure_sg(vpc_id: str | None = None) -> str:
     c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
+    vpc_id = vpc_id or vpc_mod.find_vpc_id()
     r = c.describe_security_groups(Filters=[
         {"Name":"vpc-id","Values":[vpc_id]},
         {"Name":"group-name","Values":[SG_NAME]}
     ]).get("SecurityGroups", [])
     if r:
         sg_id = r[0]["GroupId"]
+        # Existing SG: only authorize rules the describe response shows are missing
+        need_ingress = not _has_open_rule(r[0].get("IpPermissions", []), "tcp", 22)
+        need_egress  = not _has_open_rule(r[0].get("IpPermissionsEgress", []), "-1")
     else:
         resp = c.create_security_group(GroupName=SG_NAME, Description="SSH SG", VpcId=vpc_id,
                                        TagSpecifications=[{"ResourceType":"security-group","Tags": tags_for(SG_NAME)+[{"Key":"SpecName","Value":SPEC_SG}]}])
         sg_id = resp["GroupId"]
-        print(f"[sg] created {SG_NAME} -> {sg_id}")
+        sp_print(f"[sg] created {SG_NAME} -> {sg_id}")
+        need_ingress = need_egress = True
 
     # ingress ssh
-    try:
-        ec2().authorize_security_group_ingress(
-            GroupId=sg_id,
-            IpPermissions=[{
-                "IpProtocol":"tcp","FromPort":22,"ToPort":22,
-                "IpRanges":[{"CidrIp":"0.0.0.0/0","Description":"ssh"}],
-            }]
-        )
-        print(f"[sg] ingress ssh open on {sg_id}")
-    except ClientError as e:
-        if e.response["Error"]["Code"] != "InvalidPermission.Duplicate":
-            raise
+    if need_ingress:
+        try:
+            c.authorize_security_group_ingress(
+                GroupId=sg_id,
+                IpPermissions=[{
+                    "IpProtocol":"tcp","FromPort":22,"ToPort":22,
+                    "IpRanges":[{"CidrIp":"0.0.0.0/0","Description":"ssh"}],
+                }]
+            )
+            sp_print(f"[sg] ingress ssh open on {sg_id}")
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "InvalidPermission.Duplicate":
+                raise
 
     # egress all
-    try:
-        ec2().authorize_security_group_egress(
-            GroupId=sg_id,
-            IpPermissions=[{"IpProtocol":"-1","IpRanges":[{"CidrIp":"0.0.0.0/0","Description":"all-egress"}]}]
-        )
-    except ClientError as e:
-        if e.response["Error"]["Code"] != "InvalidPermission.Duplicate":
-            raise
+    if need_egress:
+        try:
+            c.authorize_security_group_egress(
+                GroupId=sg_id,
+                IpPermissions=[{"IpProtocol":"-1","IpRanges":[{"CidrIp":"0.0.0.0/0","Description":"all-egress"}]}]
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "InvalidPermission.Duplicate":
+                raise
 
     return sg_id
 
+@functools.lru_cache(maxsize=1)
 def _latest_al2023_ami() -> str:
+    try:
+        return client("ssm").get_parameter(Name=AL2023_SSM_PARAM)["Parameter"]["Value"]
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("ParameterNotFound", "AccessDeniedException"):
+            raise
+    # Fallback: scan the public AMI catalogue (large response)
     imgs = ec2().describe_images(
         Owners=["amazon"],
         Filters=[
@@ -120,9 +160,13 @@ def _latest_al2023_ami() -> str:
     )["Images"]
     if not imgs:
         raise SystemExit("[abort] Could not find Amazon Linux 2023 AMI in this region")
-    return sorted(imgs, key=lambda i: i["CreationDate"], reverse=True)[0]["ImageId"]
+    return max(imgs, key=itemgetter("CreationDate"))["ImageId"]
 
-def _ensure_instance(name: str, spec_label: str, subnet_id: str, public_ip: bool, sg_id: str, key_name: str):
+def _launch_instance(name: str, spec_label: str, subnet_id: str, public_ip: bool, sg_id: str, key_name: str) -> str | None:
+    """
+    Launch (or start, if stopped) the named instance without waiting.
+    Returns the instance id that still has to reach 'running', or None if nothing to wait for.
+    """
     c = ec2()
     r = c.describe_instances(
         Filters=[
@@ -135,11 +179,11 @@ def _ensure_instance(name: str, spec_label: str, subnet_id: str, public_ip: bool
         iid = inst["InstanceId"]
         state = inst["State"]["Name"]
         if state == "stopped":
-            print(f"[start] {name} -> {iid}")
+            sp_print(f"[start] {name} -> {iid}")
             c.start_instances(InstanceIds=[iid])
-            c.get_waiter("instance_running").wait(InstanceIds=[iid])
-        print(f"[ok] instance {name} -> {iid} ({state})")
-        return
+            return iid
+        sp_print(f"[ok] instance {name} -> {iid} ({state})")
+        return None
 
     ami = _latest_al2023_ami()
     ni = {
@@ -158,19 +202,35 @@ def _ensure_instance(name: str, spec_label: str, subnet_id: str, public_ip: bool
         }]
     )
     iid = resp["Instances"][0]["InstanceId"]
-    print(f"[launch] {name} -> {iid}")
-    c.get_waiter("instance_running").wait(InstanceIds=[iid])
-    print(f"[running] {name} -> {iid}")
+    sp_print(f"[launch] {name} -> {iid}")
+    return iid
+
+def _wait_running(pending: dict[str, str]) -> None:
+    """One instance_running waiter for every launched/started instance ({name: instance_id})."""
+    if not pending:
+        return
+    ec2().get_waiter("instance_running").wait(InstanceIds=list(pending.values()))
+    for name, iid in pending.items():
+        sp_print(f"[running] {name} -> {iid}")
 
-def _find_instance_id(name: str) -> str | None:
+def _find_instance_ids(names: list[str]) -> dict[str, str]:
+    """One describe_instances for several Name tags; returns {name: instance_id} for those found."""
+    if not names:
+        return {}
     r = ec2().describe_instances(Filters=[
-        {"Name":"tag:Name","Values":[name]},
+        {"Name":"tag:Name","Values":list(names)},
         {"Name":"instance-state-name","Values":["pending","running","stopping","stopped"]},
     ])["Reservations"]
-    return r[0]["Instances"][0]["InstanceId"] if r else None
+    found: dict[str, str] = {}
+    for res in r:
+        for inst in res.get("Instances", []):
+            name = name_tag(inst)
+            if name in names and name not in found:
+                found[name] = inst["InstanceId"]
+    return found
 
-def _get_sg_id() -> str | None:
-    vpc_id = vpc_mod.find_vpc_id()
+def _get_sg_id(vpc_id: str | None = None) -> str | None:
+    vpc_id = vpc_id or vpc_mod.find_vpc_id()
     if not vpc_id:
         return None
     r = ec2().describe_security_groups(Filters=[
@@ -187,71 +247,96 @@ def _purge_keypair():
     c = ec2()
     try:
         c.delete_key_pair(KeyName=KEY_NAME)
-        print(f"[purge] key-pair {KEY_NAME} deleted")
+        sp_print(f"[purge] key-pair {KEY_NAME} deleted")
     except ClientError as e:
         if e.response["Error"]["Code"] != "InvalidKeyPair.NotFound":
             raise
-    if os.path.exists(KEY_PATH):
-        try:
-            os.remove(KEY_PATH)
-            print(f"[purge] removed local key {KEY_PATH}")
-        except OSError:
-            pass
+    try:
+        os.remove(KEY_PATH)
+        sp_print(f"[purge] removed local key {KEY_PATH}")
+    except OSError:
+        pass  # includes FileNotFoundError: nothing local to remove
 
 def create(which: str):
-    vpc_mod.create()
-    sg_id = _ensure_sg()
-    key = _ensure_keypair()
-    pub_subnet = _find_subnet_id(PUBLIC_SUBNET_NAME, PUBLIC_SUBNET_CIDR)
-    prv_subnet = _find_subnet_id(PRIVATE_SUBNET_NAME, PRIVATE_SUBNET_CIDR)
+    vpc_id = vpc_mod.create()
+    # Once the VPC is known, the SG, key pair and subnet lookups are independent
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_sg  = ex.submit(_ensure_sg, vpc_id)
+        f_key = ex.submit(_ensure_keypair)
+        f_sub = ex.submit(_find_subnet_ids, [(PUBLIC_SUBNET_NAME, PUBLIC_SUBNET_CIDR),
+                                             (PRIVATE_SUBNET_NAME, PRIVATE_SUBNET_CIDR)], vpc_id)
+        sg_id, key, subnets = f_sg.result(), f_key.result(), f_sub.result()
+    pub_subnet = subnets[PUBLIC_SUBNET_NAME]
+    prv_subnet = subnets[PRIVATE_SUBNET_NAME]
+    pending: dict[str, str] = {}
     if which in ("public", "both"):
-        _ensure_instance(NAME_PUBLIC,  "mar5-demo-ec2-public",  pub_subnet, True,  sg_id, key)
+        iid = _launch_instance(NAME_PUBLIC,  "mar5-demo-ec2-public",  pub_subnet, True,  sg_id, key)
+        if iid: pending[NAME_PUBLIC] = iid
     if which in ("private", "both"):
-        _ensure_instance(NAME_PRIVATE, "mar5-demo-ec2-private", prv_subnet, False, sg_id, key)
+        iid = _launch_instance(NAME_PRIVATE, "mar5-demo-ec2-private", prv_subnet, False, sg_id, key)
+        if iid: pending[NAME_PRIVATE] = iid
+    # Launch both first, then wait once so the two boots overlap
+    _wait_running(pending)
 
-def status(which: str):
-    for label, name in (("public", NAME_PUBLIC), ("private", NAME_PRIVATE)):
-        if which != "both" and which != label:
-            continue
-        iid = _find_instance_id(name)
-        print(f"[status] {name}: {iid or 'NOT FOUND'}")
-    sg_id = _get_sg_id()
-    print(f"[status] SG {SG_NAME}: {sg_id or 'NOT FOUND'}")
-    # keypair existence
+def _keypair_exists() -> bool:
     try:
         ec2().describe_key_pairs(KeyNames=[KEY_NAME])
-        print(f"[status] KeyPair {KEY_NAME}: FOUND (local: {'yes' if os.path.exists(KEY_PATH) else 'no'})")
+        return True
     except ClientError:
-        print(f"[status] KeyPair {KEY_NAME}: NOT FOUND (local: {'yes' if os.path.exists(KEY_PATH) else 'no'})")
+        return False
+
+def status(which: str):
+    labels = [(label, name) for label, name in (("public", NAME_PUBLIC), ("private", NAME_PRIVATE))
+              if which == "both" or which == label]
+    # Instances, SG and key pair are independent reads; fetch them concurrently
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futs = {
+            ex.submit(_find_instance_ids, [name for _, name in labels]): "instances",
+            ex.submit(_get_sg_id): "sg",
+            ex.submit(_keypair_exists): "keypair",
+        }
+        got = {futs[f]: f.result() for f in as_completed(futs)}
+
+    for _, name in labels:
+        iid = got["instances"].get(name)
+        sp_print(f"[status] {name}: {iid or 'NOT FOUND'}")
+    sg_id = got["sg"]
+    sp_print(f"[status] SG {SG_NAME}: {sg_id or 'NOT FOUND'}")
+    # keypair existence
+    local = 'yes' if os.path.exists(KEY_PATH) else 'no'
+    if got["keypair"]:
+        sp_print(f"[status] KeyPair {KEY_NAME}: FOUND (local: {local})")
+    else:
+        sp_print(f"[status] KeyPair {KEY_NAME}: NOT FOUND (local: {local})")
 
 def delete(which: str, purge: bool = False):
     c = ec2()
-    ids = []
+    names = []
     if which in ("public","both"):
-        iid = _find_instance_id(NAME_PUBLIC)
-        if iid: ids.append(iid)
+        names.append(NAME_PUBLIC)
     if which in ("private","both"):
-        iid = _find_instance_id(NAME_PRIVATE)
-        if iid: ids.append(iid)
+        names.append(NAME_PRIVATE)
+    found = _find_instance_ids(names)
+    ids = [found[n] for n in names if n in found]
 
     if ids:
-        print(f"[terminate] {' '.join(ids)}")
+        sp_print(f"[terminate] {' '.join(ids)}")
         c.terminate_instances(InstanceIds=ids)
         c.get_waiter("instance_terminated").wait(InstanceIds=ids)
-        print("[terminated]")
+        sp_print("[terminated]")
     else:
-        print("[ok] no instances to terminate")
+        sp_print("[ok] no instances to terminate")
 
     if purge:
         # Delete SG (if VPC still exists and SG is unused)
         sg_id = _get_sg_id()
         if sg_id:
             if _sg_in_use(sg_id):
-                print(f"[warn] SG {sg_id} still in use; not deleting")
+                sp_print(f"[warn] SG {sg_id} still in use; not deleting")
             else:
                 try:
-                    ec2().delete_security_group(GroupId=sg_id)
-                    print(f"[purge] deleted SG {sg_id}")
+                    c.delete_security_group(GroupId=sg_id)
+                    sp_print(f"[purge] deleted SG {sg_id}")
                 except ClientError as e:
                     if e.response["Error"]["Code"] != "InvalidGroup.NotFound":
                         raise
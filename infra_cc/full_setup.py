@@ -17,15 +17,28 @@ Tiers:
 Usage:
   python -m infra_cc.full_setup up   --tier network|routing|ec2
   python -m infra_cc.full_setup down --tier ec2|routing|network [--purge]
-  python -m infra_cc.full_setup status
+  python -m infra_cc.full_setup status [--detail vpc|subnet|igw|natgw|routes|ec2|all]
 """
 
 from __future__ import annotations
-import argparse, sys, time, threading
-from botocore.exceptions import ClientError
+import argparse, contextvars, functools, io, os, queue, sys, time, threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from . import vpc, subnet, igw, natgw, routes, ec2nodes
-from .session import ec2
+from . import console
+from .console import sp_print
+
+# AWS-facing modules (and boto3 with them) are bound on first use by _import_aws(),
+# so `--help` and argument errors never pay boto3's import time.
+vpc = subnet = igw = natgw = routes = ec2nodes = None
+ec2 = client = ClientError = None
+
+def _import_aws() -> None:
+    global vpc, subnet, igw, natgw, routes, ec2nodes, ec2, client, ClientError
+    if ec2 is not None:
+        return
+    from botocore.exceptions import ClientError
+    from . import vpc, subnet, igw, natgw, routes, ec2nodes
+    from .session import ec2, client
 
 # ------------------ Config: seal threshold ------------------
 # Show the filled "[^^^^^^^]" line ONLY if a step (or wait) took at least this many seconds.
@@ -39,11 +52,19 @@ _COMET_FRAMES = [
     "[   >>> ]", "[    >>>]", "[     >>]", "[      >]", "[       ]",
 ]
 _FILLED_FRAME = "[^^^^^^^]"  # shown when sealing a long step
+_CLEAR_LINE = "\x1b[2K\r"     # ANSI: erase whole line, return to column 0 (replaces space padding)
+
+# Frames are assembled as bytes from pre-encoded pieces (no per-tick f-string/encode work)
+_COMET_FRAMES_B = tuple(f"{_CLEAR_LINE}{f} overall ".encode() for f in _COMET_FRAMES)
+_CURRENT_B = b" | current: "
 
-_spinner_stop = threading.Event()
+# One spinner "service" (spinner + writer threads, console hook) is started on first use and
+# lives for the whole process; tiers just switch it on and off.
+_spinner_active = threading.Event()   # set while a tier is running
+_spinner_parked = threading.Event()   # set once the spinner loop has cleared its line and gone idle
+_spinner_wake = threading.Event()     # interrupts the spinner's tick wait (stop / prompt change)
 _spinner_lock = threading.Lock()
 _spinner_thread: threading.Thread | None = None
-_spinner_tls = threading.local()   # lets spinner bypass stdout proxy
 
 _overall_start = 0.0
 _current_task = "starting…"
@@ -51,209 +72,386 @@ _task_start = 0.0
 _spinner_prompt = False
 _prompt_line_drawn = False
 _spinner_prompt_msg = ""           # shows exactly what the user can type (e.g., "Enter Y or N")
-_seal_pending = False              # next foreign print should seal/clear current spinner line first
+_current_task_b = b""              # _current_task pre-encoded (+ trailing space) for frames
 
-# ----- stdout proxy so ANY print seals/clears spinner line first -----
+# ----- single writer thread: spinner frames and foreign prints share one ordered queue -----
+# Only the writer touches the terminal while the spinner runs, so nothing else blocks on a
+# slow tty and no lock is needed to keep frames and prints from interleaving.
+
+_FRAME, _LINE, _FOREIGN = "frame", "line", "foreign"
 
 _stdout_real = sys.stdout
-_stdout_proxy = None
+_write_q: queue.Queue = queue.Queue()
+_writer_thread: threading.Thread | None = None
 
 def _fmt_elapsed(sec: float) -> str:
     m, s = divmod(int(sec), 60)
     return f"{m:02d}:{s:02d}"
 
-def _clear_spinner_line():
-    _spinner_tls.writing = True
+@functools.lru_cache(maxsize=4096)
+def _elapsed_b(sec: int) -> bytes:
+    return _fmt_elapsed(sec).encode()
+
+def _stdout_tty_fd() -> int | None:
     try:
-        _stdout_real.write("\r" + " " * 90 + "\r")
+        return _stdout_real.fileno() if _stdout_real.isatty() else None
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return None
+
+# Set when the spinner service starts; frames go straight to this fd on a terminal
+_FD: int | None = None
+
+def _write_frame(buf: bytes) -> None:
+    # Only the writer thread calls this, and it flushes every text write, so the text
+    # layer is empty here and raw writes can't overtake it.
+    if _FD is not None:
+        while buf:  # os.write is unbuffered: one syscall per frame (partial writes are rare)
+            buf = buf[os.write(_FD, buf):]
+        return
+    out = getattr(_stdout_real, "buffer", None)
+    if out is None:
+        _stdout_real.write(buf.decode())
+        return
+    out.write(buf)  # redirected: stays block-buffered until the next text write flushes it
+
+def _writer_active() -> bool:
+    return _spinner_active.is_set()
+
+def _emit(kind: str, text: str = "") -> None:
+    """Queue output for the writer thread (or write directly when the spinner is off)."""
+    if _writer_active():
+        _write_q.put((kind, text))
+    elif text:
+        _stdout_real.write(text)
         _stdout_real.flush()
-    finally:
-        _spinner_tls.writing = False
 
-def _seal_or_clear_current_line(per_seconds: float):
-    """If long step (>= threshold) print a filled line; else just clear spinner line."""
-    global _seal_pending
-    overall = _fmt_elapsed(time.time() - _overall_start)
+def _seal_or_clear_text(per_seconds: float, label: str | None = None) -> str:
+    """If long step (>= threshold) a filled line; else just the line-clear sequence."""
     if per_seconds >= _SEAL_THRESHOLD_SECONDS:
+        overall = _fmt_elapsed(time.time() - _overall_start)
         per = _fmt_elapsed(per_seconds)
-        _spinner_tls.writing = True
+        label = label or f"current: {_current_task}"
+        return f"{_CLEAR_LINE}{_FILLED_FRAME} overall {overall} | {label} {per}\n"
+    return _CLEAR_LINE
+
+def _writer_loop():
+    frame_on_screen = False   # a spinner frame is the last thing on the terminal line
+    line_open = False         # foreign output left a partial line; don't draw frames over it
+    while True:
+        kind, text = _write_q.get()
         try:
-            _stdout_real.write(f"\r{_FILLED_FRAME} overall {overall} | current: {_current_task} {per}\n")
+            if kind == _FRAME:
+                if line_open:
+                    continue
+                frame_on_screen = True
+                _write_frame(text)
+                continue
+            elif kind == _FOREIGN:
+                # Seal/clear the spinner line before printing foreign output
+                if frame_on_screen:
+                    _stdout_real.write(_seal_or_clear_text(time.time() - _task_start))
+                frame_on_screen = False
+                line_open = not text.endswith("\n")
+            else:  # _LINE: spinner-owned line (clear, seal, prompt, countdown)
+                frame_on_screen = False
+                line_open = False
+            _stdout_real.write(text)
             _stdout_real.flush()
         finally:
-            _spinner_tls.writing = False
-    else:
-        _clear_spinner_line()
-    with _spinner_lock:
-        _seal_pending = False
-
-class _StdoutProxy:
-    def __init__(self, real):
-        self._real = real
-
-    def write(self, s):
-        # If spinner thread is writing, or spinner inactive, just pass through
-        if getattr(_spinner_tls, "writing", False) or not _spinner_thread or not _spinner_thread.is_alive():
-            return self._real.write(s)
-
-        # Avoid interference while prompting (asterisk line is managed elsewhere)
-        if _spinner_prompt:
-            return self._real.write(s)
-
-        # If a spinner frame was drawn since last seal, seal/clear before printing foreign output
-        global _seal_pending
-        do_seal = False
-        with _spinner_lock:
-            if _seal_pending:
-                do_seal = True
-                per_seconds = time.time() - _task_start
-            # else: no need to adjust the spinner line
-
-        if do_seal:
-            _seal_or_clear_current_line(per_seconds)
+            _write_q.task_done()
 
-        return self._real.write(s)
-
-    def flush(self):
-        return self._real.flush()
+def _console_hook(text: str) -> bool:
+    """infra_cc output (console.sp_print/sp_write): queue it while the spinner runs."""
+    if not _writer_active():
+        return False
+    _write_q.put((_FOREIGN, text))
+    return True
+
+# ----- stdin: one process-wide reader once anything needs a non-blocking read -----
+# A reader thread can't be cancelled while blocked in readline(), so a per-countdown thread
+# would outlive its countdown and swallow the next answer. Instead one reader is started on
+# first use and every later line (countdown skips and _input() answers alike) comes off its queue.
+
+_stdin_lines: queue.Queue = queue.Queue()
+_stdin_reader: threading.Thread | None = None
+
+def _read_stdin_lines():
+    for line in iter(sys.stdin.readline, ""):
+        _stdin_lines.put(line)
+    _stdin_lines.put("")  # EOF marker
+
+def _ensure_stdin_reader():
+    global _stdin_reader
+    if _stdin_reader is None:
+        _stdin_reader = threading.Thread(target=_read_stdin_lines, name="stdin-reader", daemon=True)
+        _stdin_reader.start()
+
+def _next_stdin_line(timeout: float | None = None) -> str | None:
+    """Next line from the shared reader; None on timeout. Raises EOFError once stdin is closed."""
+    try:
+        line = _stdin_lines.get(timeout=timeout)
+    except queue.Empty:
+        return None
+    if not line:
+        _stdin_lines.put(line)  # keep the marker for every later reader
+        raise EOFError
+    return line
+
+def _input(prompt: str) -> str:
+    """input() that first lets the writer drain, so the prompt lands after queued output."""
+    if _writer_active():
+        _write_q.join()
+    if _stdin_reader is None:
+        return input(prompt)
+    _stdout_real.write(prompt)
+    _stdout_real.flush()
+    return _next_stdin_line().rstrip("\r\n")
 
-def _stdout_patch_start():
-    global _stdout_proxy, _stdout_real
-    if sys.stdout is _stdout_real:
-        _stdout_proxy = _StdoutProxy(_stdout_real)
-        sys.stdout = _stdout_proxy
+# ----- spinner core -----
 
-def _stdout_patch_stop():
-    global _stdout_real
-    if sys.stdout is not _stdout_real:
-        sys.stdout = _stdout_real
+# Adaptive frame pacing: react fast right after a task starts, then slow down once it settles
+_FRAME_STEP = 0.1                  # comet advances one frame per this many seconds of task time
+_TICK_FAST, _TICK_NORMAL, _TICK_SLOW = 0.016, 0.1, 0.25
+_TICK_PROMPT = 1.0                 # prompt bar is static; just keep an eye on the flags
 
-# ----- spinner core -----
+def _tick_interval(task_elapsed: float) -> float:
+    if task_elapsed < 0.1:
+        return _TICK_FAST
+    if task_elapsed < 2.0:
+        return _TICK_NORMAL
+    return _TICK_SLOW
 
 def _spinner_loop():
-    global _prompt_line_drawn, _seal_pending
-    i = 0
-    while not _spinner_stop.is_set():
+    global _prompt_line_drawn
+    last_line = None
+    next_tick = time.monotonic()
+    while True:
+        if not _spinner_active.is_set():
+            # Tier finished: clear our line once, report idle, and sleep until the next tier
+            if last_line is not None:
+                _write_q.put((_LINE, _CLEAR_LINE))
+                last_line = None
+            _spinner_parked.set()
+            _spinner_active.wait()
+            next_tick = time.monotonic()
+            continue
+        now = time.time()
         with _spinner_lock:
-            overall = _fmt_elapsed(time.time() - _overall_start)
-            per = _fmt_elapsed(time.time() - _task_start)
-            task = _current_task
+            overall_s = now - _overall_start
+            task_elapsed = now - _task_start
+            task_b = _current_task_b
             prompt = _spinner_prompt
             prompt_msg = _spinner_prompt_msg
 
         if prompt:
             if not _prompt_line_drawn:
-                _spinner_tls.writing = True
-                try:
-                    _stdout_real.write(f"\r[*******] overall {overall} | {prompt_msg}\n")
-                    _stdout_real.flush()
-                finally:
-                    _spinner_tls.writing = False
+                overall = _fmt_elapsed(overall_s)
+                _write_q.put((_LINE, f"{_CLEAR_LINE}[*******] overall {overall} | {prompt_msg}\n"))
                 _prompt_line_drawn = True
-            time.sleep(0.2)
-            continue
-
-        _prompt_line_drawn = False
-        frame = _COMET_FRAMES[i % len(_COMET_FRAMES)]
-        line = f"\r{frame} overall {overall} | current: {task} {per}"
-        _spinner_tls.writing = True
-        try:
-            _stdout_real.write(line)
-            _stdout_real.flush()
-        finally:
-            _spinner_tls.writing = False
-
-        with _spinner_lock:
-            _seal_pending = True
-
-        time.sleep(0.1)
-        i += 1
-
-    # clear the line on stop
-    _clear_spinner_line()
+            last_line = None
+            interval = _TICK_PROMPT
+        else:
+            _prompt_line_drawn = False
+            line = b"".join((
+                _COMET_FRAMES_B[int(task_elapsed / _FRAME_STEP) % len(_COMET_FRAMES_B)],
+                _elapsed_b(int(overall_s)), _CURRENT_B, task_b, _elapsed_b(int(task_elapsed)),
+            ))
+            # Only write when something visible changed (fast ticks often render the same frame)
+            if line != last_line:
+                _write_q.put((_FRAME, line))
+                last_line = line
+            interval = _tick_interval(task_elapsed)
+
+        # One wake-up per tick on a monotonic schedule; stop/prompt changes cut the wait short
+        next_tick += interval
+        delay = next_tick - time.monotonic()
+        if delay < 0:  # fell behind (e.g. suspended): don't try to catch up
+            next_tick, delay = time.monotonic(), 0.0
+        if _spinner_wake.wait(delay):
+            _spinner_wake.clear()
+            next_tick = time.monotonic()
+
+def _ensure_spinner_service():
+    global _spinner_thread, _writer_thread, _FD
+    if _spinner_thread is not None:
+        return
+    _FD = _stdout_tty_fd()
+    _writer_thread = threading.Thread(target=_writer_loop, daemon=True)
+    _writer_thread.start()
+    console.set_hook(_console_hook)
+    _spinner_thread = threading.Thread(target=_spinner_loop, daemon=True)
+    _spinner_thread.start()
 
 def _spinner_start():
-    global _spinner_thread, _overall_start, _task_start, _current_task
-    global _spinner_prompt, _prompt_line_drawn, _spinner_prompt_msg, _seal_pending
+    global _overall_start, _task_start, _current_task, _current_task_b
+    global _spinner_prompt, _prompt_line_drawn, _spinner_prompt_msg
+    _import_aws()
     _overall_start = time.time()
     _task_start = _overall_start
     _current_task = "starting…"
+    _current_task_b = f"{_current_task} ".encode()
     _spinner_prompt = False
     _prompt_line_drawn = False
     _spinner_prompt_msg = ""
-    _seal_pending = False
-    _spinner_stop.clear()
-    _stdout_patch_start()
-    _spinner_thread = threading.Thread(target=_spinner_loop, daemon=True)
-    _spinner_thread.start()
+    _VpcCtx.resolve()
+    _ensure_spinner_service()
+    _spinner_parked.clear()
+    _spinner_active.set()
 
 def _spinner_set_task(desc: str):
-    global _task_start, _current_task
+    global _task_start, _current_task, _current_task_b
     with _spinner_lock:
         _current_task = desc
+        _current_task_b = f"{desc} ".encode()
         _task_start = time.time()
-        # no need to flip _seal_pending; first frame of new task will set it
 
 def _spinner_set_prompt(on: bool, msg: str = "Waiting for input…"):
-    global _spinner_prompt, _spinner_prompt_msg, _prompt_line_drawn, _seal_pending
+    global _spinner_prompt, _spinner_prompt_msg, _prompt_line_drawn
     with _spinner_lock:
         _spinner_prompt = on
         _spinner_prompt_msg = msg
         _prompt_line_drawn = False
-        _seal_pending = False
+    _spinner_wake.set()
 
 def _spinner_stop_now():
-    _spinner_stop.set()
-    if _spinner_thread:
-        _spinner_thread.join(timeout=2.0)
-    _stdout_patch_stop()
+    if not _spinner_active.is_set():
+        return
+    _spinner_active.clear()
+    _spinner_wake.set()
+    # The loop wakes at once to clear its line and park; then let the writer drain the queue
+    _spinner_parked.wait(timeout=2.0)
+    _write_q.join()
 
 def _print_finish_line_if_long(desc: str, per_seconds: float):
     """Show the filled caret line only if the step exceeded the threshold; otherwise clear."""
-    overall = _fmt_elapsed(time.time() - _overall_start)
-    if per_seconds >= _SEAL_THRESHOLD_SECONDS:
-        per = _fmt_elapsed(per_seconds)
-        _spinner_tls.writing = True
-        try:
-            _stdout_real.write(f"\r{_FILLED_FRAME} overall {overall} | finished: {desc} {per}\n")
-            _stdout_real.flush()
-        finally:
-            _spinner_tls.writing = False
-    else:
-        _clear_spinner_line()
-    with _spinner_lock:
-        global _seal_pending
-        _seal_pending = False
+    _emit(_LINE, _seal_or_clear_text(per_seconds, f"finished: {desc}"))
 
 def _run_step(desc: str, fn, *args, **kwargs):
     """Set spinner task, run fn, then (conditionally) show a filled line and always show [done]."""
     _spinner_set_task(desc)
     t0 = time.time()
     result = fn(*args, **kwargs)
+    _hint_pollers()  # a mutating step just returned; the next predicate check must hit AWS
     per_seconds = time.time() - t0
     _print_finish_line_if_long(desc, per_seconds)
-    print(f"[done] {desc} in {_fmt_elapsed(per_seconds)}")
+    sp_print(f"[done] {desc} in {_fmt_elapsed(per_seconds)}")
     return result
 
+# Polling backs off from `poll` by doubling up to this cap (gentler on EC2 rate limits)
+_POLL_MAX_SECONDS = 6.0
+
+# Waits between polls block on these instead of sleeping, so they can be cut short:
+#   _predicate_hint — set when a mutating call returns; wake up and re-check now
+#   _cancel_poll    — set to abandon every in-progress wait (Ctrl+C, or from another thread)
+_predicate_hint = threading.Event()
+_cancel_poll = threading.Event()
+
+def _hint_pollers() -> None:
+    """Drop cached predicate results and wake any waiting _spin_until for an immediate re-check."""
+    for fn in (_nat_exists, _any_instances_in_vpc, _vpc_exists):
+        fn.cache_clear()
+    _predicate_hint.set()
+
 def _spin_until(desc: str, predicate, timeout: int = 900, poll: float = 1.5) -> bool:
-    """Keep spinner going while we wait for predicate() to become True."""
+    """Keep spinner going while we wait for predicate() to become True (exponential backoff)."""
     _spinner_set_task(desc)
     start = time.time()
-    while True:
-        if predicate():
-            per = time.time() - start
-            _print_finish_line_if_long(desc, per)
-            print(f"[done] {desc} in {_fmt_elapsed(per)}")
-            return True
-        if time.time() - start >= timeout:
-            per = time.time() - start
-            _print_finish_line_if_long(desc, per)
-            print(f"[warn] timeout waiting for: {desc} after {_fmt_elapsed(per)}")
-            return False
-        time.sleep(poll)
+    delay = poll
+    _predicate_hint.clear()  # the first check below already sees any prior mutation
+    try:
+        while True:
+            if _cancel_poll.is_set():
+                raise KeyboardInterrupt
+            if predicate():
+                per = time.time() - start
+                _print_finish_line_if_long(desc, per)
+                sp_print(f"[done] {desc} in {_fmt_elapsed(per)}")
+                return True
+            if time.time() - start >= timeout:
+                per = time.time() - start
+                _print_finish_line_if_long(desc, per)
+                sp_print(f"[warn] timeout waiting for: {desc} after {_fmt_elapsed(per)}")
+                return False
+            if _predicate_hint.wait(delay):
+                _predicate_hint.clear()
+                continue  # signalled: re-check right away, keep the current backoff
+            delay = min(delay * 2, max(poll, _POLL_MAX_SECONDS))
+    except KeyboardInterrupt:
+        _cancel_poll.set()
+        raise SystemExit(f"[abort] cancelled while {desc}")
+
+# ------------------ parallel helpers ------------------
+
+# Cap fan-out well below EC2's describe rate limits; all calls share session.ec2()'s client.
+_PARALLEL_MAX_WORKERS = 8
+
+def _parallel(calls, max_workers: int = _PARALLEL_MAX_WORKERS) -> list:
+    """Run independent (fn, *args) calls concurrently; return their results in call order."""
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as ex:
+        futs = [ex.submit(fn, *args) for fn, *args in calls]
+        return [f.result() for f in futs]
+
+# Per-thread capture buffer for status(); worker threads each run in their own context
+_capture_buf: contextvars.ContextVar[io.StringIO | None] = contextvars.ContextVar("_capture_buf", default=None)
+
+def _capture_hook(text: str) -> bool:
+    """console hook for status(): text printed by a capturing thread goes to its own buffer."""
+    buf = _capture_buf.get()
+    if buf is None:
+        return False
+    buf.write(text)
+    return True
+
+def _captured(fn, *args) -> str:
+    """Run fn in this thread with its prints buffered; return the text it printed."""
+    buf = io.StringIO()
+    token = _capture_buf.set(buf)
+    try:
+        fn(*args)
+        return buf.getvalue()
+    finally:
+        _capture_buf.reset(token)
 
 # ------------------ tiny AWS helpers ------------------
 
+class _VpcCtx:
+    """VPC id resolved once per tier run (at _spinner_start) so polling predicates skip find_vpc_id()."""
+    vpc_id: str | None = None
+
+    @classmethod
+    def resolve(cls) -> None:
+        cls.vpc_id = vpc.find_vpc_id()
+
+    @classmethod
+    def get(cls) -> str | None:
+        if cls.vpc_id is None:
+            cls.vpc_id = vpc.find_vpc_id()  # first hit after vpc.create (None until it exists)
+        return cls.vpc_id
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.vpc_id = None
+
+def _ttl_cache(seconds: float):
+    """Reuse a predicate's result for `seconds`, so back-to-back checks don't each hit AWS."""
+    def deco(fn):
+        memo: dict = {}
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = memo.get(args)
+            if hit is not None and now - hit[1] < seconds:
+                return hit[0]
+            val = fn(*args)
+            memo[args] = (val, now)
+            return val
+        wrapper.cache_clear = memo.clear
+        return wrapper
+    return deco
+
+@_ttl_cache(1.0)
 def _nat_exists() -> bool:
     c = ec2()
     try:
@@ -267,10 +465,10 @@ def _nat_exists() -> bool:
     except ClientError:
         return False
 
-def _any_instances_in_vpc() -> bool:
-    from . import vpc as vpc_mod
+@_ttl_cache(1.0)
+def _any_instances_in_vpc(vpc_id: str | None = None) -> bool:
     c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
+    vpc_id = vpc_id or _VpcCtx.get()
     if not vpc_id:
         return False
     res = c.describe_instances(
@@ -279,20 +477,31 @@ def _any_instances_in_vpc() -> bool:
             {"Name": "instance-state-name", "Values": ["pending","running","stopping","stopped"]},
         ]
     ).get("Reservations", [])
-    inst = [i for r in res for i in r.get("Instances", [])]
-    return bool(inst)
+    return any(r.get("Instances") for r in res)  # short-circuits; no flattened list
 
-def _vpc_exists() -> bool:
-    from . import vpc as vpc_mod
+@_ttl_cache(1.0)
+def _vpc_exists(vpc_id: str | None = None) -> bool:
     c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
+    vpc_id = vpc_id or _VpcCtx.get()
     if not vpc_id:
         return False
     try:
         c.describe_vpcs(VpcIds=[vpc_id])
         return True
-    except ClientError:
-        return False
+    except ClientError as e:
+        # Only NotFound means gone; anything else (throttling, auth) must not end a "VPC gone" wait
+        if e.response["Error"]["Code"] == "InvalidVpcID.NotFound":
+            return False
+        raise
+
+def _probe_state(vpc_id: str | None) -> dict:
+    """One parallel round-trip for the three teardown probes (NAT, instances, VPC)."""
+    has_nat, has_instances, vpc_present = _parallel([
+        (_nat_exists,),
+        (_any_instances_in_vpc, vpc_id),
+        (_vpc_exists, vpc_id),
+    ])
+    return {"has_nat": has_nat, "has_instances": has_instances, "vpc_present": vpc_present}
 
 # ------------------ NAT delete confirmations ------------------
 
@@ -300,20 +509,30 @@ def _confirm_nat_delete(context: str) -> None:
     """Show big banner and Y/N prompt; spinner switches to asterisk bar with explicit inputs."""
     if not _nat_exists():
         return
-    print("")
-    print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-    print("  WARNING: This operation will DELETE the NAT Gateway (and release EIP).")
-    print(f"  Context: {context}")
-    print("  NAT deletes can take a while; proceed only if you intend to remove it.")
-    print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
+    sp_print("")
+    sp_print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
+    sp_print("  WARNING: This operation will DELETE the NAT Gateway (and release EIP).")
+    sp_print(f"  Context: {context}")
+    sp_print("  NAT deletes can take a while; proceed only if you intend to remove it.")
+    sp_print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
     _spinner_set_prompt(True, "Confirm NAT deletion — enter Y or N")
     try:
-        ans = input("ARE YOU SURE? (Y/N): ").strip().lower()
+        ans = _input("ARE YOU SURE? (Y/N): ").strip().lower()
     finally:
         _spinner_set_prompt(False)
     if ans not in ("y", "yes"):
         raise SystemExit("[abort] NAT deletion cancelled by user")
 
+_COUNTDOWN_WIDTH = 40
+# Every countdown bar, indexed by the number of filled cells
+_BARS = tuple("#" * i + "-" * (_COUNTDOWN_WIDTH - i) for i in range(_COUNTDOWN_WIDTH + 1))
+
+def _countdown_prefixes(seconds: int) -> tuple:
+    """Line prefix for every T-minus value, indexed by seconds remaining (T-00..T-<seconds>)."""
+    return tuple(f"{_CLEAR_LINE}[NAT COUNTDOWN] T-{r:02d}s | " for r in range(seconds + 1))
+
+_COUNTDOWN_PREFIXES = _countdown_prefixes(60)
+
 def _nat_delete_countdown(seconds: int = 60, skippable: bool = True):
     """
     After Y/N confirmation, give a final visible countdown that the user can:
@@ -323,35 +542,31 @@ def _nat_delete_countdown(seconds: int = 60, skippable: bool = True):
     """
     if not _nat_exists():
         return
-    width = 40
     _spinner_set_prompt(True, f"NAT deletion starts in {seconds}s — Press Enter to skip, Ctrl+C to cancel")
-    print("NAT deletion will start automatically. Press Enter to skip; Ctrl+C to cancel.")
+    sp_print("NAT deletion will start automatically. Press Enter to skip; Ctrl+C to cancel.")
+    if skippable:
+        _ensure_stdin_reader()  # a thread instead of select() on stdin (which doesn't work on Windows)
+    prefixes = _COUNTDOWN_PREFIXES if seconds < len(_COUNTDOWN_PREFIXES) else _countdown_prefixes(seconds)
     try:
-        import select
-        start = time.time()
+        start = time.monotonic()
         while True:
-            elapsed = int(time.time() - start)
-            remaining = max(seconds - elapsed, 0)
-            filled = int(((seconds - remaining) / seconds) * width)
-            bar = "#" * filled + "-" * (width - filled)
-            _stdout_real.write(f"\r[NAT COUNTDOWN] T-{remaining:02d}s | {bar}")
-            _stdout_real.flush()
+            remaining = max(seconds - int(time.monotonic() - start), 0)
+            _emit(_LINE, prefixes[remaining] + _BARS[(seconds - remaining) * _COUNTDOWN_WIDTH // seconds])
             if remaining <= 0:
                 break
-            if skippable:
-                rlist, _, _ = select.select([sys.stdin], [], [], 1.0)
-                if rlist:
-                    _ = sys.stdin.readline()
-                    _stdout_real.write("\n[skip] Countdown skipped by user; proceeding with NAT deletion.\n")
-                    _stdout_real.flush()
-                    break
-            else:
+            if not skippable:
                 time.sleep(1.0)
-        _stdout_real.write("\n")
-        _stdout_real.flush()
+                continue
+            try:
+                pressed = _next_stdin_line(timeout=1.0) is not None
+            except EOFError:  # closed stdin ends the wait, as it always did
+                pressed = True
+            if pressed:
+                _emit(_LINE, "\n[skip] Countdown skipped by user; proceeding with NAT deletion.\n")
+                break
+        _emit(_LINE, "\n")
     except KeyboardInterrupt:
-        _stdout_real.write("\n[abort] NAT deletion cancelled by user\n")
-        _stdout_real.flush()
+        _emit(_LINE, "\n[abort] NAT deletion cancelled by user\n")
         _spinner_set_prompt(False)
         raise SystemExit("[abort] NAT deletion cancelled by user")
     finally:
@@ -382,39 +597,179 @@ def up_routing():
     finally:
         _spinner_stop_now()
 
+def _stack_state() -> dict:
+    """
+    Which lower-tier pieces are already in place, from one parallel round of describes.
+    (The Stack-tag summary can't tell IGW attachment or NAT state, so this uses the modules' lookups.)
+    """
+    vpc_id = vpc.find_vpc_id()
+    if not vpc_id:
+        return {"vpc": False, "subnet": False, "igw": False, "natgw": False, "rt_private": False}
+    inside, outside, (_, igw_vpc), nat, rt_id = _parallel([
+        (subnet.find_subnet_id, "inside"),
+        (subnet.find_subnet_id, "outside"),
+        (igw.find_igw,),
+        (natgw.find_natgw,),
+        (routes.find_private_rt_id,),
+    ])
+    # Only an available NAT counts: a pending one still needs natgw.create's wait, since
+    # routes.set_private_default rejects anything but available
+    nat_id, nat_subnet, _, nat_state = nat
+    return {
+        "vpc":        True,
+        "subnet":     bool(inside and outside),
+        "igw":        igw_vpc == vpc_id,
+        "natgw":      bool(nat_id) and nat_subnet == outside and nat_state == "available",
+        "rt_private": bool(rt_id),
+    }
+
+def _run_dag_step(desc: str, fn, *args):
+    """_run_step for a DAG worker: the DAG loop owns the spinner label and the filled line."""
+    t0 = time.time()
+    result = fn(*args)
+    _hint_pollers()
+    sp_print(f"[done] {desc} in {_fmt_elapsed(time.time() - t0)}")
+    return result
+
+def _run_dag(steps: list, done: set | None = None) -> None:
+    """
+    Run (key, deps, desc, fn, *args) steps, each once all of its deps are in `done`;
+    independent steps run concurrently. The spinner shows every running step, and the
+    filled line is drawn only once nothing is left running. The first failure is re-raised.
+    """
+    done = set(done or ())
+    pending = {key: (set(deps), desc, fn, args) for key, deps, desc, fn, *args in steps}
+    running: dict = {}   # future -> (key, desc)
+    batch: list = []     # descs run since the DAG last went idle
+    t_batch = 0.0
+    with ThreadPoolExecutor(max_workers=_PARALLEL_MAX_WORKERS) as ex:
+        while pending or running:
+            ready = [k for k, v in pending.items() if v[0] <= done]
+            if ready and not running:
+                t_batch = time.time()
+            for key in ready:
+                _, desc, fn, args = pending.pop(key)
+                running[ex.submit(_run_dag_step, desc, fn, *args)] = (key, desc)
+                batch.append(desc)
+            if not running:
+                raise SystemExit(f"[abort] unsatisfiable step dependencies: {sorted(pending)}")
+            _spinner_set_task(" + ".join(desc for _, desc in running.values()))
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                fut.result()
+                done.add(running.pop(fut)[0])
+            if not running:
+                _print_finish_line_if_long(" + ".join(batch), time.time() - t_batch)
+                batch.clear()
+
 def up_ec2():
     _spinner_start()
     try:
-        # lower tiers, idempotent
-        _run_step("vpc.create", vpc.create)
-        _run_step("subnet.create(both)", subnet.create, "both")
-        _run_step("igw.create_attach", igw.create_attach)
-        _run_step("natgw.create", natgw.create)
-        _run_step("routes.create_private", routes.create_private)
-        _run_step("routes.set_private_default", routes.set_private_default)
-        _run_step("routes.set_public_main", routes.set_public_main)
+        # lower tiers as a DAG: (key, deps, desc, fn, *args)
+        lower = [
+            ("vpc",        (),                              "vpc.create",              vpc.create),
+            ("subnet",     ("vpc",),                        "subnet.create(both)",     subnet.create, "both"),
+            ("igw",        ("vpc",),                        "igw.create_attach",       igw.create_attach),
+            ("rt_private", ("vpc",),                        "routes.create_private",   routes.create_private),
+            # natgw.create draws its own inline wait spinner; every other step is either one of its
+            # deps or waits on it (rt_main included), so nothing prints over that line
+            ("natgw",      ("subnet", "igw", "rt_private"), "natgw.create",            natgw.create),
+            # route targets aren't in _stack_state(); both setters are idempotent, so always run
+            ("rt_default", ("natgw", "rt_private"),         "routes.set_private_default", routes.set_private_default),
+            ("rt_main",    ("igw", "natgw"),                "routes.set_public_main",  routes.set_public_main),
+        ]
+        # One state check, then only the missing creators (independent ones concurrently)
+        have = {k for k, ok in _stack_state().items() if ok}
+        for key, _deps, desc, *_ in lower:
+            if key in have:
+                sp_print(f"[skip] {desc}: already in place")
+        _run_dag([st for st in lower if st[0] not in have], done=have)
         # ec2
         _run_step("ec2nodes.create(both)", ec2nodes.create, "both")
     finally:
         _spinner_stop_now()
 
-def status():
+_STATUS_COMPONENTS = ("vpc", "subnet", "igw", "natgw", "routes", "ec2")
+
+def _status_reports() -> dict:
+    """Per-module (describe-based) status reports, keyed by component name."""
+    return {
+        "vpc":    (vpc.status,),
+        "subnet": (subnet.status, "both"),
+        "igw":    (igw.status,),
+        "natgw":  (natgw.status,),
+        "routes": (routes.status,),
+        "ec2":    (ec2nodes.status, "both"),
+    }
+
+def _status_all() -> None:
+    # the six reports run concurrently and print in order
+    vpc.find_vpc_id()  # resolve once up front so the workers share the memoized id
+    calls = [(_captured, *report) for report in _status_reports().values()]
+    prev = console.set_hook(_capture_hook)
+    try:
+        outputs = _parallel(calls)
+    finally:
+        console.set_hook(prev)
+    for out in outputs:
+        sp_print(out, end="")
+
+def _status_bulk() -> dict | None:
+    """
+    One Resource Groups Tagging API query for everything carrying our Stack tag.
+    Returns {resource_type: [resource ids]} (e.g. {"vpc": ["vpc-0abc"]}), or None if the
+    tagging API can't be used (then status falls back to the per-module reports).
+    Note: the tagging API can lag a little, and lists terminated instances for a while.
+    """
+    from .naming import STACK
+    found: dict = {}
+    try:
+        pages = client("resourcegroupstaggingapi").get_paginator("get_resources").paginate(
+            TagFilters=[{"Key": "Stack", "Values": [STACK]}]
+        )
+        for page in pages:
+            for m in page.get("ResourceTagMappingList", []):
+                # arn:aws:ec2:<region>:<account>:<type>/<id>
+                rtype, _, rid = m["ResourceARN"].split(":", 5)[5].partition("/")
+                found.setdefault(rtype, []).append(rid)
+    except ClientError as e:
+        sp_print(f"[warn] tagging API unavailable ({e.response['Error']['Code']}); using per-module status")
+        return None
+    return found
+
+def status(detail: str | None = None):
     # no spinner needed for quick reads
-    vpc.status()
-    subnet.status("both")
-    igw.status()
-    natgw.status()
-    routes.status()
-    ec2nodes.status("both")
+    _import_aws()
+    if detail == "all":
+        _status_all()
+        return
+    if detail:
+        fn, *args = _status_reports()[detail]
+        fn(*args)
+        return
+    found = _status_bulk()
+    if found is None:
+        _status_all()
+        return
+    from .naming import STACK
+    if not found:
+        sp_print(f"[status] stack {STACK}: NOTHING FOUND")
+        return
+    total = sum(len(ids) for ids in found.values())
+    sp_print(f"[status] stack {STACK}: {total} tagged resource(s)")
+    for rtype in sorted(found):
+        sp_print(f"  {rtype}: {', '.join(sorted(found[rtype]))}")
+    sp_print("  (details: status --detail " + "|".join(_STATUS_COMPONENTS + ("all",)) + ")")
 
 # ------------------ Tear DOWN (cascading + spinner) ------------------
 
 def down_ec2(purge: bool):
     _spinner_start()
     try:
+        vpc_id = _VpcCtx.get()
         _run_step("ec2nodes.delete(both)", ec2nodes.delete, "both", purge=purge)
         # Wait until no instances remain (handles ENI lag)
-        _spin_until("waiting: EC2 instances gone", lambda: not _any_instances_in_vpc(), timeout=1200, poll=2.0)
+        _spin_until("waiting: EC2 instances gone", lambda: not _any_instances_in_vpc(vpc_id), timeout=1200, poll=2.0)
     finally:
         _spinner_stop_now()
 
@@ -422,9 +777,10 @@ def down_routing():
     _spinner_start()
     try:
         # ensure EC2 is gone first (so ENIs don't block NAT/subnet)
-        if _any_instances_in_vpc():
+        vpc_id = _VpcCtx.get()
+        if _any_instances_in_vpc(vpc_id):
             _run_step("ec2nodes.delete(both)", ec2nodes.delete, "both", purge=False)
-            _spin_until("waiting: EC2 instances gone", lambda: not _any_instances_in_vpc(), timeout=1200, poll=2.0)
+            _spin_until("waiting: EC2 instances gone", lambda: not _any_instances_in_vpc(vpc_id), timeout=1200, poll=2.0)
 
         _run_step("routes.delete_private", routes.delete_private)  # idempotent
 
@@ -439,30 +795,37 @@ def down_routing():
 def down_network(purge: bool):
     _spinner_start()
     try:
-        # Check once up front: will this run delete a NAT?
-        need_nat_delete = _nat_exists()
+        # Probe once up front (one parallel round-trip); only re-check after mutating steps
+        vpc_id = _VpcCtx.get()
+        state = _probe_state(vpc_id)
+        need_nat_delete = state["has_nat"]
         if need_nat_delete:
             _confirm_nat_delete("Deleting the VPC ('network' tier) will also delete NAT")
 
         # Cascade: ensure EC2 is gone first (so ENIs don't block NAT/subnets)
-        if _any_instances_in_vpc():
+        if state["has_instances"]:
             _run_step("ec2nodes.delete(both)", ec2nodes.delete, "both", purge=False)
             _spin_until("waiting: EC2 instances gone",
-                        lambda: not _any_instances_in_vpc(), timeout=1200, poll=2.0)
+                        lambda: not _any_instances_in_vpc(vpc_id), timeout=1200, poll=2.0)
+            if need_nat_delete:
+                state["has_nat"] = _nat_exists()
 
         # Drop private route table (idempotent)
         _run_step("routes.delete_private", routes.delete_private)
 
         # If NAT still exists, proceed without re-prompting; just do the countdown
-        if need_nat_delete and _nat_exists():
+        if need_nat_delete and state["has_nat"]:
             _nat_delete_countdown(60, skippable=True)
             _run_step("natgw.delete", natgw.delete)
             _spin_until("waiting: NAT gateway gone",
                         lambda: not _nat_exists(), timeout=900, poll=2.0)
 
         # Finally, delete the VPC via dependency pipeline
+        # (vpc.delete invalidates find_vpc_id's cache; the predicate keeps polling the old id)
         _run_step("vpc.delete", vpc.delete)
-        _spin_until("waiting: VPC gone", lambda: not _vpc_exists(), timeout=600, poll=2.0)
+        if state["vpc_present"]:
+            _spin_until("waiting: VPC gone", lambda: not _vpc_exists(vpc_id), timeout=600, poll=2.0)
+        _VpcCtx.clear()
 
         # Optional cleanups
         if purge:
@@ -485,7 +848,9 @@ def main():
     down.add_argument("--purge", action="store_true",
                       help="Also remove SSH key pair (+ local PEM); for ec2 tier also removes SG if unused")
 
-    sub.add_parser("status", help="Show status for all components")
+    st = sub.add_parser("status", help="Show status for all components")
+    st.add_argument("--detail", choices=_STATUS_COMPONENTS + ("all",),
+                    help="Run the per-component status report(s) instead of the one-call tag summary")
 
     a = ap.parse_args()
     if a.cmd == "up":
@@ -495,7 +860,7 @@ def main():
          "routing": down_routing,
          "network": lambda: down_network(a.purge)}[a.tier]()
     elif a.cmd == "status":
-        status()
+        status(a.detail)
 
 if __name__ == "__main__":
     main()
@@ -22,6 +22,7 @@ from __future__ import annotations
 import argparse
 from botocore.exceptions import ClientError
 
+from .console import sp_print
 from .session import ec2
 from .naming import res_name, tags_for
 from . import vpc as vpc_mod
@@ -30,8 +31,8 @@ from .deps import register_deleter, build_tree, prompt_and_delete
 IGW_NAME    = res_name("igw")
 SPEC_LABEL  = "mar5-demo-igw"
 
-def _tags():
-    return tags_for(IGW_NAME) + [{"Key": "SpecName", "Value": SPEC_LABEL}]
+_TAGS = tuple(tags_for(IGW_NAME) + [{"Key": "SpecName", "Value": SPEC_LABEL}])
+_IGW_FILTERS = [{"Name": "tag:Name", "Values": [IGW_NAME]}]
 
 def find_igw() -> tuple[str | None, str | None]:
     """
@@ -39,9 +40,7 @@ def find_igw() -> tuple[str | None, str | None]:
     We search by Name tag == IGW_NAME.
     """
     c = ec2()
-    resp = c.describe_internet_gateways(
-        Filters=[{"Name": "tag:Name", "Values": [IGW_NAME]}]
-    )
+    resp = c.describe_internet_gateways(Filters=_IGW_FILTERS)
     igws = resp.get("InternetGateways", [])
     if not igws:
         return (None, None)
@@ -52,73 +51,85 @@ def find_igw() -> tuple[str | None, str | None]:
     vpc_id = atts[0]["VpcId"] if atts else None
     return (igw["InternetGatewayId"], vpc_id)
 
-def create() -> str:
+def create(existing: tuple[str | None, str | None] | None = None) -> str:
+    """Create our IGW if missing. `existing` is a find_igw() result the caller already has."""
     c = ec2()
-    igw_id, attached = find_igw()
+    igw_id, attached = existing if existing is not None else find_igw()
     if igw_id:
-        print(f"[ok] IGW exists: {IGW_NAME} -> {igw_id} (attached_to={attached})")
+        sp_print(f"[ok] IGW exists: {IGW_NAME} -> {igw_id} (attached_to={attached})")
         return igw_id
     resp = c.create_internet_gateway(
-        TagSpecifications=[{"ResourceType": "internet-gateway", "Tags": _tags()}]
+        TagSpecifications=[{"ResourceType": "internet-gateway", "Tags": list(_TAGS)}]
     )
     igw_id = resp["InternetGateway"]["InternetGatewayId"]
-    print(f"[created] IGW -> {igw_id}")
+    sp_print(f"[created] IGW -> {igw_id}")
     return igw_id
 
-def attach() -> None:
+def attach(existing: tuple[str | None, str | None] | None = None) -> None:
+    """Attach our IGW to our VPC. `existing` is a find_igw() result the caller already has."""
     c = ec2()
     vpc_id = vpc_mod.create()  # ensure our VPC exists (returns vpc id)
-    igw_id, attached = find_igw()
+    igw_id, attached = existing if existing is not None else find_igw()
     if not igw_id:
-        igw_id = create()
+        igw_id = create(existing=(None, None))
         attached = None
 
     if attached == vpc_id:
-        print(f"[ok] IGW already attached: {igw_id} -> {vpc_id}")
+        sp_print(f"[ok] IGW already attached: {igw_id} -> {vpc_id}")
         return
     if attached and attached != vpc_id:
         raise SystemExit(f"[abort] IGW {igw_id} is attached to a different VPC {attached}")
 
     c.attach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
-    print(f"[attached] {igw_id} -> {vpc_id}")
+    sp_print(f"[attached] {igw_id} -> {vpc_id}")
 
 def create_attach() -> None:
-    create()
-    attach()
+    found = find_igw()  # one describe shared by create + attach
+    igw_id = create(existing=found)
+    attach(existing=(igw_id, found[1]))
 
 def status() -> None:
     igw_id, attached = find_igw()
     if not igw_id:
-        print(f"[status] IGW {IGW_NAME}: NOT FOUND")
+        sp_print(f"[status] IGW {IGW_NAME}: NOT FOUND")
         return
-    print(f"[status] IGW={igw_id} attached_to={attached}")
+    sp_print(f"[status] IGW={igw_id} attached_to={attached}")
 
 @register_deleter("internet-gateway")
-def _delete_igw(igw_id: str) -> None:
-    """Deleter for the pipeline: safely detach from any VPCs, then delete."""
+def _delete_igw(igw_id: str, meta: dict | None = None) -> None:
+    """
+    Deleter for the pipeline: safely detach from any VPCs, then delete.
+    `meta["attached_vpc_ids"]` (from whoever found the IGW) skips the describe here.
+    """
     c = ec2()
-    try:
-        igw = c.describe_internet_gateways(InternetGatewayIds=[igw_id])["InternetGateways"][0]
-    except ClientError as e:
-        code = e.response["Error"]["Code"]
-        if code in ("InvalidInternetGatewayID.NotFound",):
-            print(f"[delete] igw {igw_id} already gone")
-            return
-        raise
+    vpc_ids = (meta or {}).get("attached_vpc_ids")
+    if vpc_ids is None:
+        try:
+            igw = c.describe_internet_gateways(InternetGatewayIds=[igw_id])["InternetGateways"][0]
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code in ("InvalidInternetGatewayID.NotFound",):
+                sp_print(f"[delete] igw {igw_id} already gone")
+                return
+            raise
+        vpc_ids = [att.get("VpcId") for att in igw.get("Attachments", [])]
 
     # Detach from all attachments (normally one)
-    for att in igw.get("Attachments", []):
-        vpc_id = att.get("VpcId")
+    for vpc_id in vpc_ids:
         if vpc_id:
             try:
-                print(f"[detach] igw {igw_id} from vpc {vpc_id}")
+                sp_print(f"[detach] igw {igw_id} from vpc {vpc_id}")
                 c.detach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
             except ClientError as e:
                 if e.response["Error"]["Code"] not in ("Gateway.NotAttached", "InvalidInternetGatewayID.NotFound"):
                     raise
 
-    print(f"[delete] igw {igw_id}")
-    c.delete_internet_gateway(InternetGatewayId=igw_id)
+    sp_print(f"[delete] igw {igw_id}")
+    try:
+        c.delete_internet_gateway(InternetGatewayId=igw_id)
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("InvalidInternetGatewayID.NotFound",):
+            raise
 
 def delete() -> None:
     """
@@ -126,18 +137,19 @@ def delete() -> None:
       - Build tree at the IGW itself (no children -> no prompt).
       - Pipeline calls our registered deleter above.
     """
-    igw_id, _ = find_igw()
+    igw_id, attached = find_igw()
     if not igw_id:
-        print(f"[ok] nothing to delete: IGW {IGW_NAME} not found")
+        sp_print(f"[ok] nothing to delete: IGW {IGW_NAME} not found")
         return
 
-    root = build_tree(kind="internet-gateway", rid=igw_id, name=IGW_NAME, reason="detach then delete")
+    root = build_tree(kind="internet-gateway", rid=igw_id, name=IGW_NAME, reason="detach then delete",
+                      meta={"attached_vpc_ids": [attached] if attached else []})
     try:
         # No dependencies -> framework will skip prompt and just delete.
         prompt_and_delete(root, delete_root=True)
-        print(f"[deleted] igw {igw_id}")
+        sp_print(f"[deleted] igw {igw_id}")
     except Exception as e:
-        print(f"[abort] {e}")
+        sp_print(f"[abort] {e}")
 
 def main():
     ap = argparse.ArgumentParser(description="Internet Gateway create/attach/status/delete")
@@ -7,7 +7,7 @@
 # Keep ALL naming/tags here so you change them once if needed.
 
 from __future__ import annotations
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Base parts of your convention
 PREFIX = "nainoa-faulkner-jackson"
@@ -42,6 +42,14 @@ def tags_for(name: str) -> List[Dict[str, str]]:
         {"Key": "Assignment",  "Value": "HW3"},
     ]
 
+def name_tag(res: dict) -> Optional[str]:
+    """The 'Name' tag of a describe_* result item (subnet, SG, IGW, instance, ...), or None."""
+    tags = res.get("Tags") or ()
+    # tags_for() puts Name first, so resources we created usually hit on index 0
+    if tags and tags[0]["Key"] == "Name":
+        return tags[0]["Value"]
+    return {t["Key"]: t["Value"] for t in tags}.get("Name")
+
 # -------------------- Self-test harness --------------------
 def _self_test() -> int:
     """
@@ -16,9 +16,11 @@ Run (from project root):
 """
 
 from __future__ import annotations
-import argparse, time, sys
+import argparse, threading, time, uuid
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 
+from .console import sp_print, sp_write
 from .session import ec2
 from .naming  import res_name, tags_for
 from . import vpc as vpc_mod
@@ -34,11 +36,19 @@ SPEC_EIP     = "mar5-demo-ngw-eip"
 PUBLIC_SUBNET_NAME = res_name("subnet-outside")
 PUBLIC_SUBNET_CIDR = "10.0.0.0/24"
 
-def _tags_nat():
-    return tags_for(NATGW_NAME) + [{"Key": "SpecName", "Value": SPEC_NG}]
+# Tags and filters below depend only on the names above: build them once at import
+_TAGS_NAT = tuple(tags_for(NATGW_NAME) + [{"Key": "SpecName", "Value": SPEC_NG}])
+_TAGS_EIP = tuple(tags_for(NAT_EIP_NAME) + [{"Key": "SpecName", "Value": SPEC_EIP}])
 
-def _tags_eip():
-    return tags_for(NAT_EIP_NAME) + [{"Key": "SpecName", "Value": SPEC_EIP}]
+_PUBLIC_SUBNET_FILTERS = (
+    {"Name": "cidr-block", "Values": [PUBLIC_SUBNET_CIDR]},
+    {"Name": "tag:Name", "Values": [PUBLIC_SUBNET_NAME]},
+)
+_ACTIVE_NAT_FILTERS = [
+    {"Name": "tag:Name", "Values": [NATGW_NAME]},
+    {"Name": "state",    "Values": ["pending", "available"]},  # key filter
+]
+_EIP_FILTERS = [{"Name": "tag:Name", "Values": [NAT_EIP_NAME]}]
 
 # ---------- Pretty CLI helpers ----------
 _SPINNER_FRAMES = "|/-\\"
@@ -47,74 +57,83 @@ def _fmt_elapsed(sec: float) -> str:
     m, s = divmod(int(sec), 60)
     return f"{m:02d}:{s:02d}"
 
-def _wait_nat_state(nat_id: str, target: set[str], timeout: int = 900, poll: float = 5.0, phase: str = "") -> str:
+_REDRAW_SECONDS = 0.25
+# Describe backoff: start at `poll`, grow x1.5 per attempt, never wait longer than this
+_POLL_BACKOFF = 1.5
+_POLL_MAX_SECONDS = 30.0
+_NOT_FOUND = ("NatGatewayNotFound", "InvalidNatGatewayID.NotFound")
+
+def _wait_nat_state(nat_id: str, target: set[str], timeout: int = 900, poll: float = 15.0, phase: str = "") -> str:
     """
     Show a spinner + elapsed timer until NAT reaches any state in `target`.
-    Handles NotFound for delete waits.
+    A worker thread describes the NAT on a growing backoff (15s -> x1.5 -> capped at 30s;
+    NAT transitions take a minute or two, so faster polling buys nothing);
+    this thread only redraws the line a few times a second. Handles NotFound for delete waits.
     """
-    c = ec2()
+    seen = {"state": None}   # latest state, read by the redraw loop
+    outcome: dict = {}
+    done = threading.Event()
+    stop = threading.Event()  # set by the caller (Ctrl+C) to end the worker's wait early
+
+    def _poll():
+        c = ec2()
+        deadline = time.monotonic() + timeout
+        delay = poll
+        try:
+            while True:
+                try:
+                    state = c.describe_nat_gateways(NatGatewayIds=[nat_id])["NatGateways"][0].get("State")
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in _NOT_FOUND or "deleted" not in target:
+                        raise
+                    state = "deleted"
+                seen["state"] = state
+                if state in target or state == "failed":
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                if stop.wait(min(delay, remaining)):
+                    return
+                delay = min(delay * _POLL_BACKOFF, _POLL_MAX_SECONDS)
+        except BaseException as e:  # surfaced in the calling thread below
+            outcome["raise"] = e
+        finally:
+            done.set()
+
     start = time.time()
-    last_state = None
-    last_check = 0.0
+    threading.Thread(target=_poll, name=f"wait-{nat_id}", daemon=True).start()
     i = 0
-    # initial one-line so users see something immediately
-    sys.stdout.write(f"[wait] NAT {nat_id} {phase} | state=... | elapsed 00:00 {_SPINNER_FRAMES[0]}")
-    sys.stdout.flush()
-
-    while True:
-        now = time.time()
-        elapsed = now - start
-
-        # Re-check state on the poll cadence
-        if elapsed - last_check >= poll:
-            last_check = elapsed
-            try:
-                gw = c.describe_nat_gateways(NatGatewayIds=[nat_id])["NatGateways"][0]
-                last_state = gw.get("State")
-                if last_state in target:
-                    sys.stdout.write(f"\r[wait] NAT {nat_id} {phase} | state={last_state} | elapsed {_fmt_elapsed(elapsed)}   \n")
-                    sys.stdout.flush()
-                    return last_state
-                if last_state == "failed":
-                    sys.stdout.write(f"\r[wait] NAT {nat_id} {phase} | state=failed | elapsed {_fmt_elapsed(elapsed)}   \n")
-                    sys.stdout.flush()
-                    raise SystemExit(f"[abort] NAT {nat_id} entered state=failed")
-            except ClientError as e:
-                code = e.response["Error"]["Code"]
-                if code in ("NatGatewayNotFound", "InvalidNatGatewayID.NotFound"):
-                    if "deleted" in target:
-                        sys.stdout.write(f"\r[wait] NAT {nat_id} {phase} | state=deleted | elapsed {_fmt_elapsed(elapsed)}   \n")
-                        sys.stdout.flush()
-                        return "deleted"
-                else:
-                    sys.stdout.write("\n")
-                    raise
-
-        # Timeout?
-        if elapsed >= timeout:
-            sys.stdout.write(f"\r[wait] NAT {nat_id} {phase} | state={last_state or '...'} | elapsed {_fmt_elapsed(elapsed)}   \n")
-            sys.stdout.flush()
-            raise SystemExit(f"[timeout] NAT {nat_id} did not reach {target} within {_fmt_elapsed(elapsed)}")
-
-        # Animate spinner smoothly
-        frame = _SPINNER_FRAMES[i % len(_SPINNER_FRAMES)]
-        sys.stdout.write(f"\r[wait] NAT {nat_id} {phase} | state={last_state or '...'} | elapsed {_fmt_elapsed(elapsed)} {frame}")
-        sys.stdout.flush()
-        time.sleep(0.1)
-        i += 1
+    try:
+        while not done.wait(0 if i == 0 else _REDRAW_SECONDS):
+            frame = _SPINNER_FRAMES[i % len(_SPINNER_FRAMES)]
+            sp_write(f"\r[wait] NAT {nat_id} {phase} | state={seen['state'] or '...'} | elapsed {_fmt_elapsed(time.time() - start)} {frame}", flush=True)
+            i += 1
+    except KeyboardInterrupt:
+        stop.set()
+        sp_write("\n")
+        raise
+
+    elapsed = _fmt_elapsed(time.time() - start)
+    if "raise" in outcome:
+        sp_write("\n")
+        raise outcome["raise"]
+    state = seen["state"]
+    sp_write(f"\r[wait] NAT {nat_id} {phase} | state={state or '...'} | elapsed {elapsed}   \n", flush=True)
+    if state in target:
+        return state
+    if state == "failed":
+        raise SystemExit(f"[abort] NAT {nat_id} entered state=failed")
+    raise SystemExit(f"[timeout] NAT {nat_id} did not reach {target} within {elapsed}")
 
 # ---- Find helpers ----
-def _find_public_subnet_id() -> str | None:
+def _find_public_subnet_id(vpc_id: str | None = None) -> str | None:
     c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
+    vpc_id = vpc_id or vpc_mod.find_vpc_id()
     if not vpc_id:
         return None
     resp = c.describe_subnets(
-        Filters=[
-            {"Name": "vpc-id", "Values": [vpc_id]},
-            {"Name": "cidr-block", "Values": [PUBLIC_SUBNET_CIDR]},
-            {"Name": "tag:Name", "Values": [PUBLIC_SUBNET_NAME]},
-        ]
+        Filters=[{"Name": "vpc-id", "Values": [vpc_id]}, *_PUBLIC_SUBNET_FILTERS]
     )
     subs = resp.get("Subnets", [])
     if not subs:
@@ -123,18 +142,13 @@ def _find_public_subnet_id() -> str | None:
         raise SystemExit(f"[abort] multiple public subnets match {PUBLIC_SUBNET_NAME} {PUBLIC_SUBNET_CIDR}")
     return subs[0]["SubnetId"]
 
-def _find_natgw() -> tuple[str | None, str | None, str | None, str | None]:
+def find_natgw() -> tuple[str | None, str | None, str | None, str | None]:
     """
     Return (nat_gateway_id, subnet_id, allocation_id, state) for an *active* NAT by Name tag.
     Ignore tombstones in 'deleting'/'deleted' so create() can proceed immediately.
     """
     c = ec2()
-    resp = c.describe_nat_gateways(
-        Filters=[
-            {"Name": "tag:Name", "Values": [NATGW_NAME]},
-            {"Name": "state",    "Values": ["pending", "available"]},  # key filter
-        ]
-    )
+    resp = c.describe_nat_gateways(Filters=_ACTIVE_NAT_FILTERS)
     ngws = resp.get("NatGateways", [])
     if not ngws:
         return (None, None, None, None)
@@ -151,9 +165,7 @@ def _find_eip_allocation() -> str | None:
     If it's still associated (e.g., ghosting on a NAT/ENI), return None so we allocate a fresh one.
     """
     c = ec2()
-    addrs = c.describe_addresses(
-        Filters=[{"Name": "tag:Name", "Values": [NAT_EIP_NAME]}]
-    ).get("Addresses", [])
+    addrs = c.describe_addresses(Filters=_EIP_FILTERS).get("Addresses", [])
     if not addrs:
         return None
     # Prefer an address that isn't associated to anything
@@ -165,111 +177,157 @@ def _find_eip_allocation() -> str | None:
 
 def _allocate_eip_tagged() -> str:
     c = ec2()
-    resp = c.allocate_address(Domain="vpc")
+    resp = c.allocate_address(
+        Domain="vpc",
+        TagSpecifications=[{"ResourceType": "elastic-ip", "Tags": list(_TAGS_EIP)}],
+    )
     alloc_id = resp["AllocationId"]
-    c.create_tags(Resources=[alloc_id], Tags=_tags_eip())
-    print(f"[allocated] EIP -> {alloc_id}")
+    sp_print(f"[allocated] EIP -> {alloc_id}")
     return alloc_id
 
+def _create_nat_idempotent(subnet_id: str, alloc_id: str) -> str:
+    """
+    create_nat_gateway with a ClientToken. The client's adaptive retries already re-send on
+    throttling, 5xx and connection/read timeouts; the token makes those re-sends safe, since a
+    request that did reach EC2 before failing on our side returns that same NAT, not a second one.
+    The token is per call (not derived from the name), so a later re-create after a delete
+    can never be answered with the old, deleted NAT.
+    """
+    resp = ec2().create_nat_gateway(
+        SubnetId=subnet_id, AllocationId=alloc_id, ClientToken=uuid.uuid4().hex,
+        TagSpecifications=[{"ResourceType": "natgateway", "Tags": list(_TAGS_NAT)}],
+    )
+    return resp["NatGateway"]["NatGatewayId"]
+
 # ---- Actions ----
 def create() -> None:
     total_start = time.time()
 
-    # Ensure VPC + public subnet
+    # Ensure VPC, then look up public subnet / existing NAT / free EIP concurrently (independent)
     vpc_id = vpc_mod.create()
-    subnet_id = _find_public_subnet_id()
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_sub = ex.submit(_find_public_subnet_id, vpc_id)
+        f_nat = ex.submit(find_natgw)
+        f_eip = ex.submit(_find_eip_allocation)
+        subnet_id, (nat_id, nat_subnet, alloc_id, state), free_eip = f_sub.result(), f_nat.result(), f_eip.result()
     if not subnet_id:
         raise SystemExit(f"[abort] public subnet not found: {PUBLIC_SUBNET_NAME} ({PUBLIC_SUBNET_CIDR}). "
                          f"Run: python -m infra_cc.subnet create --which outside")
 
-    nat_id, nat_subnet, alloc_id, state = _find_natgw()
     if nat_id:
         if nat_subnet != subnet_id:
             raise SystemExit(f"[abort] NAT {nat_id} exists in a different subnet {nat_subnet}; expected {subnet_id}")
-        print(f"[ok] NAT exists: {nat_id} in subnet {subnet_id} (state={state}, eip_alloc={alloc_id})")
+        if state == "pending":
+            # Still coming up (e.g. an interrupted earlier run): routes need it available
+            sp_print(f"[wait] NAT {nat_id} exists but is still pending")
+            state = _wait_nat_state(nat_id, {"available", "failed"}, phase="becoming available")
+            if state != "available":
+                raise SystemExit(f"[abort] NAT {nat_id} entered state={state}")
+        sp_print(f"[ok] NAT exists: {nat_id} in subnet {subnet_id} (state={state}, eip_alloc={alloc_id})")
         return
 
     # Ensure we have a tagged EIP allocation
-    alloc_id = _find_eip_allocation() or _allocate_eip_tagged()
+    alloc_id = free_eip or _allocate_eip_tagged()
 
     # Create the NAT gateway
-    c = ec2()
-    resp = c.create_nat_gateway(SubnetId=subnet_id, AllocationId=alloc_id)
-    nat_id = resp["NatGateway"]["NatGatewayId"]
-    c.create_tags(Resources=[nat_id], Tags=_tags_nat())
-    print(f"[creating] NAT -> {nat_id} (subnet={subnet_id}, eip_alloc={alloc_id})")
+    nat_id = _create_nat_idempotent(subnet_id, alloc_id)
+    sp_print(f"[creating] NAT -> {nat_id} (subnet={subnet_id}, eip_alloc={alloc_id})")
 
     # Wait until available (spinner)
     final_state = _wait_nat_state(nat_id, {"available", "failed"}, phase="becoming available")
     if final_state != "available":
         raise SystemExit(f"[abort] NAT {nat_id} entered state={final_state}")
 
-    print(f"[created] NAT {nat_id} (state=available) in {_fmt_elapsed(time.time() - total_start)}")
+    sp_print(f"[created] NAT {nat_id} (state=available) in {_fmt_elapsed(time.time() - total_start)}")
 
 def status() -> None:
-    nat_id, subnet_id, alloc_id, state = _find_natgw()
+    nat_id, subnet_id, alloc_id, state = find_natgw()
     if not nat_id:
-        print("[status] NAT: NOT FOUND")
+        sp_print("[status] NAT: NOT FOUND")
         return
-    print(f"[status] NAT={nat_id} state={state} subnet={subnet_id} eip_alloc={alloc_id}")
+    sp_print(f"[status] NAT={nat_id} state={state} subnet={subnet_id} eip_alloc={alloc_id}")
 
 @register_checker("nat-gateway")
 def _check_nat_blockers(nat_id: str):
     # NAT has no child blockers in our model (leaf)
     return []
 
+# EIP release while the NAT is still detaching from it: these clear on their own
+_EIP_IN_USE = ("InvalidIPAddress.InUse", "DependencyViolation", "AuthFailure")
+_RELEASE_ATTEMPTS = 6
+_RELEASE_BACKOFF = 5.0   # seconds, times the attempt number
+
 @register_deleter("nat-gateway")
-def _delete_nat(nat_id: str) -> None:
-    """Delete NAT and then release its Elastic IP allocation, with spinner."""
+def _delete_nat(nat_id: str, meta: dict | None = None) -> None:
+    """
+    Delete NAT and then release its Elastic IP allocation, with spinner.
+    `meta["alloc_id"]` (filled in by whoever already described the NAT) skips the describe here.
+    """
     c = ec2()
-    alloc_id = None
-    try:
-        gw = c.describe_nat_gateways(NatGatewayIds=[nat_id])["NatGateways"][0]
-        addrs = gw.get("NatGatewayAddresses", [])
-        alloc_id = addrs[0].get("AllocationId") if addrs else None
-    except ClientError as e:
-        code = e.response["Error"]["Code"]
-        if code in ("NatGatewayNotFound", "InvalidNatGatewayID.NotFound"):
-            print(f"[delete] nat {nat_id} already gone")
-            alloc_id = None
-        else:
-            raise
+    alloc_id = (meta or {}).get("alloc_id")
+    if not alloc_id:
+        try:
+            gw = c.describe_nat_gateways(NatGatewayIds=[nat_id])["NatGateways"][0]
+            addrs = gw.get("NatGatewayAddresses", [])
+            alloc_id = addrs[0].get("AllocationId") if addrs else None
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code in _NOT_FOUND:
+                sp_print(f"[delete] nat {nat_id} already gone")
+                alloc_id = None
+            else:
+                raise
 
-    print(f"[delete] nat {nat_id}")
+    sp_print(f"[delete] nat {nat_id}")
     try:
         c.delete_nat_gateway(NatGatewayId=nat_id)
     except ClientError as e:
-        if e.response["Error"]["Code"] not in ("NatGatewayNotFound", "InvalidNatGatewayID.NotFound"):
+        if e.response["Error"]["Code"] not in _NOT_FOUND:
             raise
 
-    # Wait until fully deleted before releasing EIP (spinner)
+    if not alloc_id:
+        return
+    # Release the EIP as soon as the NAT lets go of it, instead of waiting out the whole
+    # teardown first; only if it is still held after the retries do we wait for "deleted".
+    sp_print(f"[release] eip allocation {alloc_id}")
+    for attempt in range(1, _RELEASE_ATTEMPTS + 1):
+        try:
+            c.release_address(AllocationId=alloc_id)
+            return
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code == "InvalidAllocationID.NotFound":
+                return
+            if code not in _EIP_IN_USE:
+                raise
+        if attempt < _RELEASE_ATTEMPTS:
+            time.sleep(_RELEASE_BACKOFF * attempt)
+
     try:
         _wait_nat_state(nat_id, {"deleted"}, phase="deleting")
     except SystemExit:
         # Treat timeout as best-effort; many accounts return NotFound quickly
         pass
-
-    if alloc_id:
-        try:
-            print(f"[release] eip allocation {alloc_id}")
-            c.release_address(AllocationId=alloc_id)
-        except ClientError as e:
-            if e.response["Error"]["Code"] not in ("InvalidAllocationID.NotFound", "AuthFailure"):
-                raise
+    try:
+        c.release_address(AllocationId=alloc_id)
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("InvalidAllocationID.NotFound", "AuthFailure"):
+            raise
 
 def delete() -> None:
-    nat_id, _, _, _ = _find_natgw()
+    nat_id, _, alloc_id, _ = find_natgw()
     if not nat_id:
-        print("[ok] nothing to delete: NAT not found")
+        sp_print("[ok] nothing to delete: NAT not found")
         return
 
     # NAT is a leaf; the framework will skip prompt if there are no children
-    root = build_tree(kind="nat-gateway", rid=nat_id, name=NATGW_NAME, reason="delete NAT then release EIP")
+    root = build_tree(kind="nat-gateway", rid=nat_id, name=NATGW_NAME, reason="delete NAT then release EIP",
+                      meta={"alloc_id": alloc_id} if alloc_id else None)
     try:
         prompt_and_delete(root, delete_root=True)
-        print(f"[deleted] NAT {nat_id}")
+        sp_print(f"[deleted] NAT {nat_id}")
     except Exception as e:
-        print(f"[abort] {e}")
+        sp_print(f"[abort] {e}")
 
 def main():
     ap = argparse.ArgumentParser(description="NAT Gateway create/status/delete")
@@ -15,9 +15,11 @@ Idempotent operations. Includes status and delete of the private RT.
 
 from __future__ import annotations
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 
-from .session import ec2
+from .console import sp_print
+from .session import describe_all, ec2
 from .naming  import res_name, tags_for
 from . import vpc as vpc_mod
 from .igw import find_igw as _find_igw
@@ -29,58 +31,71 @@ SPEC_PRIVATE    = "mar5-demo-rt-private"
 PRIVATE_SUBNET_NAME = res_name("subnet-inside")
 PRIVATE_SUBNET_CIDR = "10.0.1.0/24"
 
-def _tags_private():
-    return tags_for(RT_PRIVATE_NAME) + [{"Key": "SpecName", "Value": SPEC_PRIVATE}]
-
-def _find_private_subnet_id() -> str | None:
+# Built once at import: none of these depend on anything but the names above
+_TAGS_PRIVATE = tuple(tags_for(RT_PRIVATE_NAME) + [{"Key": "SpecName", "Value": SPEC_PRIVATE}])
+_PRIVATE_SUBNET_FILTERS = (
+    {"Name":"cidr-block","Values":[PRIVATE_SUBNET_CIDR]},
+    {"Name":"tag:Name","Values":[PRIVATE_SUBNET_NAME]},
+)
+_AVAILABLE_NAT_FILTERS = [
+    {"Name":"tag:Name","Values":[NATGW_NAME]},
+    {"Name":"state","Values":["available"]},
+]
+
+def _find_private_subnet_id(vpc_id: str | None = None) -> str | None:
     c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
+    vpc_id = vpc_id or vpc_mod.find_vpc_id()
     if not vpc_id:
         return None
-    resp = c.describe_subnets(Filters=[
-        {"Name":"vpc-id","Values":[vpc_id]},
-        {"Name":"cidr-block","Values":[PRIVATE_SUBNET_CIDR]},
-        {"Name":"tag:Name","Values":[PRIVATE_SUBNET_NAME]},
-    ])
+    resp = c.describe_subnets(Filters=[{"Name":"vpc-id","Values":[vpc_id]}, *_PRIVATE_SUBNET_FILTERS])
     subs = resp.get("Subnets", [])
     if not subs: return None
     if len(subs) > 1: raise SystemExit(f"[abort] multiple private subnets match {PRIVATE_SUBNET_NAME} {PRIVATE_SUBNET_CIDR}")
     return subs[0]["SubnetId"]
 
-def _find_private_rt_id() -> str | None:
-    c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
-    if not vpc_id: return None
-    r = c.describe_route_tables(Filters=[
-        {"Name":"vpc-id","Values":[vpc_id]},
-        {"Name":"tag:Name","Values":[RT_PRIVATE_NAME]},
-    ]).get("RouteTables", [])
+def _load_route_tables(vpc_id: str) -> list[dict]:
+    """Every route table in our VPC, in one describe (private/main are picked out locally)."""
+    return describe_all(ec2(), "describe_route_tables", "RouteTables", Filters=[{"Name":"vpc-id","Values":[vpc_id]}])
+
+def _private_rt(rts: list[dict]) -> dict | None:
+    r = [t for t in rts if any(g["Key"] == "Name" and g["Value"] == RT_PRIVATE_NAME for g in t.get("Tags", []))]
     if not r: return None
     if len(r) > 1: raise SystemExit(f"[abort] multiple route tables named {RT_PRIVATE_NAME}")
-    return r[0]["RouteTableId"]
-
-def _find_main_rt_id() -> str:
-    c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
-    if not vpc_id: raise SystemExit("[abort] VPC not found for main route table")
-    r = c.describe_route_tables(Filters=[
-        {"Name":"vpc-id","Values":[vpc_id]},
-        {"Name":"association.main","Values":["true"]},
-    ]).get("RouteTables", [])
-    if not r: raise SystemExit("[abort] main route table not found")
-    return r[0]["RouteTableId"]
+    return r[0]
+
+def _main_rt(rts: list[dict]) -> dict:
+    r = next((t for t in rts if any(a.get("Main") for a in t.get("Associations", []))), None)
+    if r is None: raise SystemExit("[abort] main route table not found")
+    return r
+
+def find_private_rt_id(rts: list[dict] | None = None, vpc_id: str | None = None) -> str | None:
+    if rts is None:
+        vpc_id = vpc_id or vpc_mod.find_vpc_id()
+        if not vpc_id: return None
+        rts = _load_route_tables(vpc_id)
+    r = _private_rt(rts)
+    return r["RouteTableId"] if r else None
+
+def _find_main_rt_id(rts: list[dict] | None = None, vpc_id: str | None = None) -> str:
+    if rts is None:
+        vpc_id = vpc_id or vpc_mod.find_vpc_id()
+        if not vpc_id: raise SystemExit("[abort] VPC not found for main route table")
+        rts = _load_route_tables(vpc_id)
+    return _main_rt(rts)["RouteTableId"]
 
 def create_private() -> str:
     c = ec2()
     vpc_id = vpc_mod.create()
-    rt_id = _find_private_rt_id()
+    rt_id = find_private_rt_id(vpc_id=vpc_id)
     if rt_id:
-        print(f"[ok] private RT exists: {RT_PRIVATE_NAME} -> {rt_id}")
+        sp_print(f"[ok] private RT exists: {RT_PRIVATE_NAME} -> {rt_id}")
         return rt_id
-    rt = c.create_route_table(VpcId=vpc_id)["RouteTable"]
+    rt = c.create_route_table(
+        VpcId=vpc_id,
+        TagSpecifications=[{"ResourceType": "route-table", "Tags": list(_TAGS_PRIVATE)}],
+    )["RouteTable"]
     rt_id = rt["RouteTableId"]
-    c.create_tags(Resources=[rt_id], Tags=_tags_private())
-    print(f"[created] private RT -> {rt_id}")
+    sp_print(f"[created] private RT -> {rt_id}")
     return rt_id
 
 def _ensure_subnet_association(rt_id: str, subnet_id: str):
@@ -93,105 +108,115 @@ def _ensure_subnet_association(rt_id: str, subnet_id: str):
         assoc = r[0]["Associations"][0]
         cur_rt = r[0]["RouteTableId"]
         if cur_rt == rt_id:
-            print(f"[ok] subnet {subnet_id} already associated with {rt_id}")
+            sp_print(f"[ok] subnet {subnet_id} already associated with {rt_id}")
             return
         # Replace association to our RT
-        print(f"[assoc] replacing association {assoc['RouteTableAssociationId']} -> {rt_id}")
+        sp_print(f"[assoc] replacing association {assoc['RouteTableAssociationId']} -> {rt_id}")
         c.replace_route_table_association(AssociationId=assoc["RouteTableAssociationId"], RouteTableId=rt_id)
         return
     # No association yet
     c.associate_route_table(RouteTableId=rt_id, SubnetId=subnet_id)
-    print(f"[assoc] subnet {subnet_id} -> {rt_id}")
+    sp_print(f"[assoc] subnet {subnet_id} -> {rt_id}")
+
+def _find_available_nat_id() -> str | None:
+    """An AVAILABLE NAT with our Name (ignore tombstones)."""
+    ngws = ec2().describe_nat_gateways(Filters=_AVAILABLE_NAT_FILTERS).get("NatGateways", [])
+    return ngws[0]["NatGatewayId"] if ngws else None
+
+def _has_default_route(rt: dict | None) -> bool:
+    return bool(rt) and any(r.get("DestinationCidrBlock") == "0.0.0.0/0" for r in rt.get("Routes", []))
+
+def _upsert_default_route(rt_id: str, exists: bool, label: str, **target) -> None:
+    """
+    Point 0.0.0.0/0 in `rt_id` at `target` (NatGatewayId=... or GatewayId=...).
+    `exists` comes from the route table we already described, so a rerun goes straight to
+    replace_route; the duplicate/missing fallbacks only cover a race with another writer.
+    """
+    c = ec2()
+    dest = next(iter(target.values()))
+    op, verb = (c.replace_route, "replaced") if exists else (c.create_route, "created")
+    try:
+        op(RouteTableId=rt_id, DestinationCidrBlock="0.0.0.0/0", **target)
+    except ClientError as e:
+        code = e.response["Error"]["Code"]
+        if not exists and code in ("RouteAlreadyExists", "InvalidRoute.Duplicate"):
+            op, verb = c.replace_route, "replaced"
+        elif exists and code == "InvalidRoute.NotFound":
+            op, verb = c.create_route, "created"
+        else:
+            raise
+        op(RouteTableId=rt_id, DestinationCidrBlock="0.0.0.0/0", **target)
+    sp_print(f"[route] {label}{rt_id}: 0.0.0.0/0 -> {dest} ({verb})")
 
 def set_private_default():
-    c = ec2()
-    rt_id = _find_private_rt_id() or create_private()
-    subnet_id = _find_private_subnet_id()
+    vpc_id = vpc_mod.find_vpc_id()  # resolve once; the lookups below share it
+    # Three independent lookups: run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_rts = ex.submit(_load_route_tables, vpc_id) if vpc_id else None
+        f_sub = ex.submit(_find_private_subnet_id, vpc_id)
+        f_nat = ex.submit(_find_available_nat_id)
+        rt = _private_rt(f_rts.result()) if f_rts else None
+        subnet_id, nat_id = f_sub.result(), f_nat.result()
+    rt_id = rt["RouteTableId"] if rt else create_private()
     if not subnet_id:
         raise SystemExit(f"[abort] private subnet not found: {PRIVATE_SUBNET_NAME} ({PRIVATE_SUBNET_CIDR})")
     _ensure_subnet_association(rt_id, subnet_id)
 
-    # Find an AVAILABLE NAT with our Name (ignore tombstones)
-    resp = c.describe_nat_gateways(Filters=[
-        {"Name":"tag:Name","Values":[NATGW_NAME]},
-        {"Name":"state","Values":["available"]},
-    ])
-    ngws = resp.get("NatGateways", [])
-    if not ngws:
+    if not nat_id:
         raise SystemExit("[abort] NAT gateway not found/available. Run: python -m infra_cc.natgw create")
-    nat_id = ngws[0]["NatGatewayId"]
 
-    # Upsert: try create, fall back to replace if it already exists
-    try:
-        c.create_route(RouteTableId=rt_id, DestinationCidrBlock="0.0.0.0/0", NatGatewayId=nat_id)
-        print(f"[route] {rt_id}: 0.0.0.0/0 -> {nat_id} (created)")
-    except ClientError as e:
-        code = e.response["Error"]["Code"]
-        if code in ("RouteAlreadyExists", "InvalidRoute.Duplicate"):
-            c.replace_route(RouteTableId=rt_id, DestinationCidrBlock="0.0.0.0/0", NatGatewayId=nat_id)
-            print(f"[route] {rt_id}: 0.0.0.0/0 -> {nat_id} (replaced)")
-        else:
-            raise
+    # Routes were read with the table: create or replace directly (no failed create on reruns)
+    _upsert_default_route(rt_id, _has_default_route(rt), "", NatGatewayId=nat_id)
 
 
 def set_public_main():
-    c = ec2()
-    rt_main = _find_main_rt_id()
+    vpc_id = vpc_mod.find_vpc_id()
+    if not vpc_id: raise SystemExit("[abort] VPC not found for main route table")
+    rt_main = _main_rt(_load_route_tables(vpc_id))
     igw_id, attached = _find_igw()
     if not igw_id or not attached:
         raise SystemExit("[abort] IGW not found/attached. Run: python -m infra_cc.igw create-attach")
 
-    # Upsert: try create, fall back to replace if it already exists
-    try:
-        c.create_route(RouteTableId=rt_main, DestinationCidrBlock="0.0.0.0/0", GatewayId=igw_id)
-        print(f"[route] main {rt_main}: 0.0.0.0/0 -> {igw_id} (created)")
-    except ClientError as e:
-        code = e.response["Error"]["Code"]
-        if code in ("RouteAlreadyExists", "InvalidRoute.Duplicate"):
-            c.replace_route(RouteTableId=rt_main, DestinationCidrBlock="0.0.0.0/0", GatewayId=igw_id)
-            print(f"[route] main {rt_main}: 0.0.0.0/0 -> {igw_id} (replaced)")
-        else:
-            raise
+    _upsert_default_route(rt_main["RouteTableId"], _has_default_route(rt_main), "main ", GatewayId=igw_id)
 
 
 def status():
-    c = ec2()
     vpc_id = vpc_mod.find_vpc_id()
     if not vpc_id:
-        print("[status] VPC: NOT FOUND")
+        sp_print("[status] VPC: NOT FOUND")
         return
+    rts = _load_route_tables(vpc_id)  # one describe: both views come from this list
 
     # Private RT
-    rt_id = _find_private_rt_id()
-    if not rt_id:
-        print(f"[status] private RT {RT_PRIVATE_NAME}: NOT FOUND")
+    rt = _private_rt(rts)
+    if not rt:
+        sp_print(f"[status] private RT {RT_PRIVATE_NAME}: NOT FOUND")
     else:
-        rt = c.describe_route_tables(RouteTableIds=[rt_id])["RouteTables"][0]
         assoc_subnets = [a.get("SubnetId") for a in rt.get("Associations", []) if not a.get("Main")]
         default = next((r for r in rt.get("Routes", []) if r.get("DestinationCidrBlock")=="0.0.0.0/0"), {})
         target = default.get("NatGatewayId") or default.get("GatewayId") or default.get("NetworkInterfaceId")
-        print(f"[status] private RT {rt_id} assoc={assoc_subnets} default-> {target}")
+        sp_print(f"[status] private RT {rt['RouteTableId']} assoc={assoc_subnets} default-> {target}")
 
     # Main RT
-    rt_main = _find_main_rt_id()
-    rt = c.describe_route_tables(RouteTableIds=[rt_main])["RouteTables"][0]
+    rt = _main_rt(rts)
     default = next((r for r in rt.get("Routes", []) if r.get("DestinationCidrBlock")=="0.0.0.0/0"), {})
     target = default.get("GatewayId") or default.get("NatGatewayId") or default.get("NetworkInterfaceId")
-    print(f"[status] main RT {rt_main} default-> {target}")
+    sp_print(f"[status] main RT {rt['RouteTableId']} default-> {target}")
 
 def delete_private():
     c = ec2()
-    rt_id = _find_private_rt_id()
-    if not rt_id:
-        print(f"[ok] nothing to delete: {RT_PRIVATE_NAME}")
+    vpc_id = vpc_mod.find_vpc_id()
+    rt = _private_rt(_load_route_tables(vpc_id)) if vpc_id else None
+    if not rt:
+        sp_print(f"[ok] nothing to delete: {RT_PRIVATE_NAME}")
         return
-    rt = c.describe_route_tables(RouteTableIds=[rt_id])["RouteTables"][0]
+    rt_id = rt["RouteTableId"]
     for a in rt.get("Associations", []):
         if a.get("Main"):
             continue
-        print(f"[disassoc] {a['RouteTableAssociationId']}")
+        sp_print(f"[disassoc] {a['RouteTableAssociationId']}")
         c.disassociate_route_table(AssociationId=a["RouteTableAssociationId"])
-    print(f"[delete] route-table {rt_id}")
+    sp_print(f"[delete] route-table {rt_id}")
     c.delete_route_table(RouteTableId=rt_id)
 
 def main():
@@ -8,27 +8,114 @@
 #   - This module NEVER creates/modifies resources in its self-test.
 #     It only queries identity (STS) and lists basic info.
 #   - Keep constants in one place to avoid drift across scripts.
+#   - The STS account check is cached on disk (~/.cache/infra_cc/sts.json) for a few
+#     minutes so back-to-back CLI runs don't each pay the round-trip.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+from .console import sp_print
+
 # --- Your class context (edit here if these ever change) ---
 PROFILE = "cloud_computing_CC"     # named AWS CLI profile you configured
 REGION  = "us-west-1"              # default region for this project
 ACCOUNT = "049930841222"           # hard safety guard (your account id)
 
+# Verified (profile + credentials -> account) entries are trusted this long before asking STS again.
+IDENTITY_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "infra_cc", "sts.json")
+IDENTITY_CACHE_TTL  = 15 * 60  # seconds
+
 # --- Internal singletons/flags ---
 _SESSION_SINGLETON: boto3.Session | None = None
 _PRINTED = False
+_CLIENTS: dict[str, Any] = {}     # one low-level client per service name, built on first use
+_FIRST_AZ: str | None = None      # first AZ in REGION, looked up once (see first_az)
+# boto3 Sessions are not thread-safe when creating clients (deps.build_tree fans out checkers).
+_CLIENT_LOCK = threading.Lock()
+# Shared by every client we build: a pool big enough for the thread-pool fan-outs (the
+# default of 10 would queue them), adaptive retries to absorb EC2 throttling,
+# bounded timeouts so a stuck connection can't hang a tier, and TCP keepalive so
+# pooled connections survive the NAT waits instead of paying a fresh TLS handshake.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=5,
+    read_timeout=30,
+    tcp_keepalive=True,
+)
+
+
+def _credential_key(s: boto3.Session) -> str | None:
+    """
+    Digest of the access key id the session resolves to (never the key itself), so a profile
+    re-pointed at other credentials misses the cache; None if no credentials resolve.
+    """
+    try:
+        creds = s.get_credentials()
+        access_key = creds.get_frozen_credentials().access_key if creds is not None else None
+    except BotoCoreError:
+        return None
+    return hashlib.sha256(access_key.encode()).hexdigest() if access_key else None
+
+
+def _load_cached_identity(profile: str, cred_key: str | None) -> str | None:
+    """
+    Account id cached for `profile` if the entry hasn't expired and was verified with the same
+    credentials; None on miss/mismatch/any read error.
+    """
+    if cred_key is None:
+        return None
+    try:
+        with open(IDENTITY_CACHE_PATH, encoding="utf-8") as f:
+            entry = json.load(f).get(profile) or {}
+    except (OSError, ValueError, AttributeError):
+        return None
+    if entry.get("expires", 0) <= time.time() or entry.get("cred_key") != cred_key:
+        return None
+    return entry.get("account")
+
+
+def _store_cached_identity(profile: str, cred_key: str | None, acct: str) -> None:
+    """Record a verified account for `profile`. Written to a temp file + os.replace (atomic); best effort."""
+    if cred_key is None:
+        return
+    try:
+        with open(IDENTITY_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    data[profile] = {"account": acct, "cred_key": cred_key, "expires": time.time() + IDENTITY_CACHE_TTL}
+    tmp = f"{IDENTITY_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(IDENTITY_CACHE_PATH), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, IDENTITY_CACHE_PATH)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 
 def session() -> boto3.Session:
     """
     Return a singleton boto3 Session pinned to PROFILE/REGION.
     On first call:
-      - Verifies the current caller identity matches ACCOUNT.
+      - Verifies the current caller identity matches ACCOUNT (STS, or the on-disk cache
+        when a recent run already verified this profile with the same credentials).
       - Prints a one-line context banner for human sanity.
     """
     global _SESSION_SINGLETON, _PRINTED
@@ -37,16 +124,21 @@ def session() -> boto3.Session:
         # Create a new session explicitly tied to profile+region.
         s = boto3.Session(profile_name=PROFILE, region_name=REGION)
 
-        # Safety: verify account once (no side effects; read-only STS call).
-        try:
-            sts = s.client("sts")
-            ident = sts.get_caller_identity()  # {Account, Arn, UserId}
-            acct = ident["Account"]
-        except (BotoCoreError, ClientError) as e:
-            raise SystemExit(f"[abort] Could not obtain caller identity via STS: {e}") from e
+        # Safety: verify account once (no side effects; read-only STS call on a cache miss).
+        cred_key = _credential_key(s)
+        acct = _load_cached_identity(PROFILE, cred_key)
+        if acct is None:
+            try:
+                sts = s.client("sts", config=_CLIENT_CONFIG)
+                ident = sts.get_caller_identity()  # {Account, Arn, UserId}
+                acct = ident["Account"]
+            except (BotoCoreError, ClientError) as e:
+                raise SystemExit(f"[abort] Could not obtain caller identity via STS: {e}") from e
+            if acct == ACCOUNT:
+                _store_cached_identity(PROFILE, cred_key, acct)  # only ever cache an account that passed the guard
 
         if not _PRINTED:
-            print(f"[ctx] profile={PROFILE} region={REGION} account={acct}")
+            sp_print(f"[ctx] profile={PROFILE} region={REGION} account={acct}")
             _PRINTED = True
 
         if acct != ACCOUNT:
@@ -62,8 +154,18 @@ def client(service_name: str):
     """
     Shorthand: get a low-level client (dict-style API) for any service.
     Example: ec2 = client('ec2'); s3 = client('s3')
+    Clients are cached per service: building one loads the service model and endpoint
+    resolver, and every cached client keeps its warm HTTPS connection pool.
     """
-    return session().client(service_name)
+    c = _CLIENTS.get(service_name)
+    if c is not None:
+        return c
+    s = session()
+    with _CLIENT_LOCK:
+        c = _CLIENTS.get(service_name)  # another thread may have built it meanwhile
+        if c is None:
+            c = _CLIENTS[service_name] = s.client(service_name, config=_CLIENT_CONFIG)
+        return c
 
 
 def resource(service_name: str):
@@ -71,14 +173,47 @@ def resource(service_name: str):
     Shorthand: get a high-level resource object (object-style API) where supported.
     Example: s3r = resource('s3'); ddb = resource('dynamodb')
     """
-    return session().resource(service_name)
+    s = session()
+    with _CLIENT_LOCK:
+        return s.resource(service_name, config=_CLIENT_CONFIG)
 
 
 def ec2():
-    """Common convenience: EC2 client (covers VPC/subnets/IGW/route tables)."""
+    """Common convenience: EC2 client (covers VPC/subnets/IGW/route tables). Built once per process."""
     return client("ec2")
 
 
+def describe_all(c, op: str, key: str, **kwargs) -> list:
+    """
+    Every item under `key` across all pages of `op` (e.g. "describe_subnets", "Subnets").
+    Uses the botocore paginator when the operation has one, else follows NextToken by hand,
+    so large accounts never get a silently truncated first page.
+    """
+    if c.can_paginate(op):
+        return [item for page in c.get_paginator(op).paginate(**kwargs) for item in page.get(key, [])]
+    call, items = getattr(c, op), []
+    while True:
+        page = call(**kwargs)
+        items.extend(page.get(key, []))
+        token = page.get("NextToken")
+        if not token:
+            return items
+        kwargs = {**kwargs, "NextToken": token}
+
+
+def first_az() -> str:
+    """
+    First Availability Zone in REGION (where our subnets go). REGION is pinned, so the
+    answer is fixed: describe once per process and reuse.
+    """
+    global _FIRST_AZ
+    if _FIRST_AZ is None:
+        _FIRST_AZ = ec2().describe_availability_zones(
+            Filters=[{"Name": "region-name", "Values": [REGION]}]
+        )["AvailabilityZones"][0]["ZoneName"]
+    return _FIRST_AZ
+
+
 # -------------------- Self-test harness --------------------
 def _self_test() -> int:
     """
@@ -91,22 +226,22 @@ def _self_test() -> int:
     """
     try:
         s = session()  # triggers context print + account guard
-        print(f"[ok] boto3 profile={s.profile_name} region={s.region_name}")
+        sp_print(f"[ok] boto3 profile={s.profile_name} region={s.region_name}")
 
-        ec2c = s.client("ec2")
+        ec2c = ec2()  # the shared, cached client every module uses
 
         # 1) Regions list (prove we can talk to EC2)
         regs = ec2c.describe_regions(AllRegions=False)["Regions"]
         names = sorted(r["RegionName"] for r in regs)
-        print(f"[ok] reachable regions example (subset) = {names[:5]}{' …' if len(names)>5 else ''}")
+        sp_print(f"[ok] reachable regions example (subset) = {names[:5]}{' …' if len(names)>5 else ''}")
 
         # 2) VPC list (read-only; zero impact)
         vpcs = ec2c.describe_vpcs(MaxResults=5).get("Vpcs", [])
-        print(f"[ok] sample VPC count in {s.region_name}: {len(vpcs)} (showing up to 5)")
+        sp_print(f"[ok] sample VPC count in {s.region_name}: {len(vpcs)} (showing up to 5)")
 
         return 0
     except (BotoCoreError, ClientError) as e:
-        print(f"[fail] self-test error: {e}")
+        sp_print(f"[fail] self-test error: {e}")
         return 2
 
 
@@ -17,10 +17,11 @@ from __future__ import annotations
 import argparse
 from botocore.exceptions import ClientError
 
-from .session import ec2
+from .console import sp_print
+from .session import describe_all, ec2, first_az
 from .naming import res_name, tags_for
 from . import vpc as vpc_mod
-from .deps import register_checker, register_deleter, Blocker, build_tree, prompt_and_delete
+from .deps import register_checker, register_deleter, Blocker, build_tree, current_snapshot, prompt_and_delete
 
 # Configuration for both subnets
 SUBNETS = {
@@ -40,95 +41,100 @@ SUBNETS = {
 
 ORDER = ("inside", "outside")  # deterministic order for "both"
 
-def _tags(which: str):
-    cfg = SUBNETS[which]
-    return tags_for(cfg["name"]) + [{"Key": "SpecName", "Value": cfg["spec_label"]}]
+# Per-subnet tag sets, built once at import
+_TAGS = {w: tuple(tags_for(cfg["name"]) + [{"Key": "SpecName", "Value": cfg["spec_label"]}])
+         for w, cfg in SUBNETS.items()}
 
-def _find(which: str) -> str | None:
-    """Return SubnetId if exactly one subnet matches Name+CIDR in our VPC; else None."""
-    c = ec2()
-    vpc_id = vpc_mod.find_vpc_id()
-    if not vpc_id:
-        return None
+def _load_subnets(vpc_id: str) -> list[dict]:
+    """All subnets in our VPC, in one describe (callers match Name+CIDR locally)."""
+    return describe_all(ec2(), "describe_subnets", "Subnets", Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
+
+def _match(subs: list[dict], which: str) -> dict | None:
+    """The one subnet in `subs` matching `which`'s Name+CIDR; None if absent."""
     cfg = SUBNETS[which]
-    resp = c.describe_subnets(
-        Filters=[
-            {"Name": "vpc-id", "Values": [vpc_id]},
-            {"Name": "cidr-block", "Values": [cfg["cidr"]]},
-            {"Name": "tag:Name", "Values": [cfg["name"]]},
-        ]
-    )
-    subs = resp.get("Subnets", [])
-    if not subs:
-        return None
-    if len(subs) > 1:
-        raise SystemExit(f"[abort] multiple {which} subnets match Name+CIDR in VPC {vpc_id}")
-    return subs[0]["SubnetId"]
-
-def create(which: str) -> None:
+    hits = [s for s in subs
+            if s.get("CidrBlock") == cfg["cidr"]
+            and any(t["Key"] == "Name" and t["Value"] == cfg["name"] for t in s.get("Tags", []))]
+    if len(hits) > 1:
+        raise SystemExit(f"[abort] multiple {which} subnets match Name+CIDR in VPC {hits[0]['VpcId']}")
+    return hits[0] if hits else None
+
+def find_subnet_id(which: str, subs: list[dict] | None = None) -> str | None:
+    """Return SubnetId if exactly one subnet matches Name+CIDR in our VPC; else None."""
+    if subs is None:
+        vpc_id = vpc_mod.find_vpc_id()
+        if not vpc_id:
+            return None
+        subs = _load_subnets(vpc_id)
+    hit = _match(subs, which)
+    return hit["SubnetId"] if hit else None
+
+def create(which: str, subs: list[dict] | None = None) -> None:
     c = ec2()
     # Ensure VPC exists and get its ID
     vpc_id = vpc_mod.create()
 
     if which == "both":
+        subs = _load_subnets(vpc_id)
         for w in ORDER:
-            create(w)
+            create(w, subs)
         return
 
     cfg = SUBNETS[which]
-    existing = _find(which)
+    existing = find_subnet_id(which, subs)
     if existing:
-        print(f"[ok] {which} subnet exists: {cfg['name']} ({cfg['cidr']}) -> {existing}")
+        sp_print(f"[ok] {which} subnet exists: {cfg['name']} ({cfg['cidr']}) -> {existing}")
         return
 
-    # Pick the first AZ in the region for simplicity
-    az = c.describe_availability_zones(
-        Filters=[{"Name": "region-name", "Values": [c.meta.region_name]}]
-    )["AvailabilityZones"][0]["ZoneName"]
+    # Pick the first AZ in the region for simplicity (cached for the process)
+    az = first_az()
 
     resp = c.create_subnet(
         VpcId=vpc_id,
         CidrBlock=cfg["cidr"],
         AvailabilityZone=az,
-        TagSpecifications=[{"ResourceType": "subnet", "Tags": _tags(which)}],
+        TagSpecifications=[{"ResourceType": "subnet", "Tags": list(_TAGS[which])}],
     )
     sub_id = resp["Subnet"]["SubnetId"]
     # Configure auto-assign public IP setting
     c.modify_subnet_attribute(SubnetId=sub_id, MapPublicIpOnLaunch={"Value": bool(cfg["auto_public"])})
 
-    print(f"[created] {which} subnet -> {sub_id}")
-    print(f"  Name={cfg['name']}  CIDR={cfg['cidr']}  AZ={az}  AutoPublic={cfg['auto_public']}")
+    sp_print(f"[created] {which} subnet -> {sub_id}")
+    sp_print(f"  Name={cfg['name']}  CIDR={cfg['cidr']}  AZ={az}  AutoPublic={cfg['auto_public']}")
 
-def status(which: str) -> None:
+def status(which: str, subs: list[dict] | None = None) -> None:
+    if subs is None:
+        vpc_id = vpc_mod.find_vpc_id()
+        subs = _load_subnets(vpc_id) if vpc_id else []
     if which == "both":
         for w in ORDER:
-            status(w)
+            status(w, subs)  # one describe serves both printouts
         return
 
-    c = ec2()
-    sub_id = _find(which)
     cfg = SUBNETS[which]
-    if not sub_id:
-        print(f"[status] {which} subnet ({cfg['name']} {cfg['cidr']}): NOT FOUND")
+    s = _match(subs, which)
+    if not s:
+        sp_print(f"[status] {which} subnet ({cfg['name']} {cfg['cidr']}): NOT FOUND")
         return
-    s = c.describe_subnets(SubnetIds=[sub_id])["Subnets"][0]
+    sub_id = s["SubnetId"]
     tags = {t["Key"]: t["Value"] for t in s.get("Tags", [])}
-    print(f"[status] {which} subnet -> {sub_id}")
-    print(f"  CIDR={s['CidrBlock']}  AZ={s['AvailabilityZone']}  MapPublicIpOnLaunch={s.get('MapPublicIpOnLaunch')}")
-    print(f"  Name={tags.get('Name')}  Tags={tags}")
+    sp_print(f"[status] {which} subnet -> {sub_id}")
+    sp_print(f"  CIDR={s['CidrBlock']}  AZ={s['AvailabilityZone']}  MapPublicIpOnLaunch={s.get('MapPublicIpOnLaunch')}")
+    sp_print(f"  Name={tags.get('Name')}  Tags={tags}")
 
-def delete(which: str) -> None:
+def delete(which: str, subs: list[dict] | None = None) -> None:
     if which == "both":
+        vpc_id = vpc_mod.find_vpc_id()
+        subs = _load_subnets(vpc_id) if vpc_id else []
         # Delete outside first (future-proof for NAT), then inside
         for w in reversed(ORDER):
-            delete(w)
+            delete(w, subs)
         return
 
-    c = ec2()
-    sub_id = _find(which)
+    sub_id = find_subnet_id(which, subs)
     cfg = SUBNETS[which]
     if not sub_id:
-        print(f"[ok] nothing to delete: {which} subnet ({cfg['name']})")
+        sp_print(f"[ok] nothing to delete: {which} subnet ({cfg['name']})")
         return
 
     # Build tree at the subnet as root and prompt; this works for ANY entrypoint
@@ -136,9 +142,9 @@ def delete(which: str) -> None:
     try:
         prompt_and_delete(root, delete_root=True)
     except Exception as e:
-        print(f"[abort] {e}")
+        sp_print(f"[abort] {e}")
         return
-    print(f"[deleted] {which} subnet -> {sub_id}")
+    sp_print(f"[deleted] {which} subnet -> {sub_id}")
 
 # ---- Dependency + deleter registration for subnets ----
 @register_checker("subnet")
@@ -146,26 +152,37 @@ def _check_subnet_blockers(subnet_id: str):
     """Report blockers that would prevent deleting a subnet (read-only)."""
     c = ec2()
     blockers: list[Blocker] = []
+    # Inside vpc.delete() the whole VPC was already described once: filter that locally
+    graph = current_snapshot()
+    if graph is not None and subnet_id not in graph["subnet_ids"]:
+        graph = None
 
     # NAT gateways in this subnet (would block subnet deletion if present)
     try:
-        ngws = c.describe_nat_gateways(
-            Filters=[{"Name": "subnet-id", "Values": [subnet_id]}]
-        ).get("NatGateways", [])
+        if graph is not None:
+            ngws = [g for g in graph["nats"] if g.get("SubnetId") == subnet_id]
+        else:
+            ngws = describe_all(c, "describe_nat_gateways", "NatGateways",
+                                Filters=[{"Name": "subnet-id", "Values": [subnet_id]}])
         for g in ngws:
+            addrs = g.get("NatGatewayAddresses", [])
+            alloc_id = addrs[0].get("AllocationId") if addrs else None
             blockers.append(Blocker(
                 kind="nat-gateway",
                 id=g["NatGatewayId"],
                 reason=f"state={g.get('State','unknown')}",
+                meta={"alloc_id": alloc_id} if alloc_id else {},
             ))
     except Exception:
         pass  # permissions vary; fail-soft
 
     # ENIs in this subnet (any attached interface blocks deletion)
     try:
-        enis = c.describe_network_interfaces(
-            Filters=[{"Name": "subnet-id", "Values": [subnet_id]}]
-        ).get("NetworkInterfaces", [])
+        if graph is not None:
+            enis = [e for e in graph["enis"] if e.get("SubnetId") == subnet_id]
+        else:
+            enis = describe_all(c, "describe_network_interfaces", "NetworkInterfaces",
+                                Filters=[{"Name": "subnet-id", "Values": [subnet_id]}])
         for eni in enis:
             att = eni.get("Attachment") or {}
             owner = att.get("InstanceId") or att.get("NetworkInterfaceId") or "attached"
@@ -180,10 +197,10 @@ def _check_subnet_blockers(subnet_id: str):
     return blockers
 
 @register_deleter("subnet")
-def _delete_subnet(subnet_id: str):
+def _delete_subnet(subnet_id: str, meta: dict | None = None):
     """Deleter for subnets (assumes blockers removed)."""
     c = ec2()
-    print(f"[delete] subnet {subnet_id}")
+    sp_print(f"[delete] subnet {subnet_id}")
     c.delete_subnet(SubnetId=subnet_id)
 
 def main():
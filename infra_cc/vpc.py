@@ -12,122 +12,233 @@ Create / Status / Delete for the assignment's VPC step.
 
 from __future__ import annotations
 import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 
-from .session import ec2
-from .naming import res_name, tags_for
-from .deps import Blocker, build_tree, prompt_and_delete, register_checker, register_deleter
+from .console import sp_print
+from .session import describe_all, ec2
+from .naming import name_tag, res_name, tags_for
+from .deps import (Blocker, build_tree, current_snapshot, prompt_and_delete, register_bulk_deleter,
+                   register_checker, register_deleter)
 
 # ----- Assignment specifics -----
 VPC_CIDR   = "10.0.0.0/16"
 SPEC_LABEL = "mar5-demo"
 VPC_NAME   = res_name("vpc")  # e.g., nainoa-faulkner-jackson-vpc_HW3_CC
 
-def _common_tags():
-    return tags_for(VPC_NAME) + [{"Key": "SpecName", "Value": SPEC_LABEL}]
+_COMMON_TAGS = tuple(tags_for(VPC_NAME) + [{"Key": "SpecName", "Value": SPEC_LABEL}])
+
+def _common_tags() -> list[dict]:
+    """Fresh list over the frozen tag set (the dicts are shared; don't mutate them)."""
+    return list(_COMMON_TAGS)
+
+_VPC_FILTERS = [
+    {"Name": "tag:Name",   "Values": [VPC_NAME]},
+    {"Name": "cidr-block", "Values": [VPC_CIDR]},
+]
+_VPC_TAG_FILTERS = [
+    {"Name": "resource-type", "Values": ["vpc"]},
+    {"Name": "key",           "Values": ["Name"]},
+    {"Name": "value",         "Values": [VPC_NAME]},
+]
 
 # ----- Find helpers -----
+# (vpc_id, monotonic time it was resolved); every module asks for the id, so reuse it briefly.
+_VPC_CACHE_TTL = 60.0
+_vpc_cache: tuple[str | None, float] | None = None
+
+def _invalidate_vpc_cache() -> None:
+    """Forget the resolved id; create() and delete() call this when they change the answer."""
+    global _vpc_cache
+    _vpc_cache = None
+
 def find_vpc_id() -> str | None:
+    """
+    Resolve our VPC by Name+CIDR. The answer (including "not found") is reused for
+    _VPC_CACHE_TTL seconds, so a run's many callers share one lookup.
+    """
+    global _vpc_cache
+    hit = _vpc_cache
+    if hit is not None and time.monotonic() - hit[1] < _VPC_CACHE_TTL:
+        return hit[0]
+    vpc_id = _describe_vpc_id()
+    _vpc_cache = (vpc_id, time.monotonic())
+    return vpc_id
+
+def _describe_vpc_id() -> str | None:
+    """
+    Name tag -> candidate ids via describe_tags (ids only, no VPC records), then CIDR checked
+    on just those ids. The common "no VPC yet" answer costs the one describe_tags call.
+    """
     c = ec2()
-    resp = c.describe_vpcs(
-        Filters=[
-            {"Name": "tag:Name",   "Values": [VPC_NAME]},
-            {"Name": "cidr-block", "Values": [VPC_CIDR]},
-        ]
-    )
-    vpcs = resp.get("Vpcs", [])
+    ids = [t["ResourceId"] for t in describe_all(c, "describe_tags", "Tags", Filters=_VPC_TAG_FILTERS)]
+    if not ids:
+        return None
+    try:
+        vpcs = c.describe_vpcs(VpcIds=ids).get("Vpcs", [])
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "InvalidVpcID.NotFound":
+            raise
+        vpcs = c.describe_vpcs(Filters=_VPC_FILTERS).get("Vpcs", [])  # one was deleted under us
+    vpcs = [v for v in vpcs if v.get("CidrBlock") == VPC_CIDR]
     if not vpcs:
         return None
     if len(vpcs) > 1:
         raise SystemExit(f"[abort] multiple VPCs match Name={VPC_NAME} CIDR={VPC_CIDR}; resolve manually.")
     return vpcs[0]["VpcId"]
 
-# ----- Dependency registration for "vpc", "internet-gateway", "security-group" -----
-@register_checker("vpc")
-def _check_vpc_blockers(vpc_id: str):
+# ----- Dependency registration for "vpc", "security-group" (internet-gateway lives in igw.py) -----
+def _check_vpc_blockers_bulk(vpc_ids: list[str]) -> dict[str, list[Blocker]]:
     """
-    Immediate blockers for a VPC:
-      - subnets
-      - attached internet gateways
-      - NON-DEFAULT security groups
-    Subnet children (e.g., NAT, ENIs) are expanded by their own checkers.
+    Immediate blockers for several VPCs at once: one describe per resource type with every
+    vpc-id in the filter, then results are grouped by VpcId locally (3 calls for any N).
     """
+    vpc_ids = list(dict.fromkeys(vpc_ids))
+    out: dict[str, list[Blocker]] = {v: [] for v in vpc_ids}
+    if not vpc_ids:
+        return out
     c = ec2()
-    blockers: list[Blocker] = []
+    flt = [{"Name": "vpc-id", "Values": vpc_ids}]
+    # Three independent describes: run them concurrently (wall time = the slowest one)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_subs = ex.submit(describe_all, c, "describe_subnets", "Subnets", Filters=flt)
+        f_igws = ex.submit(describe_all, c, "describe_internet_gateways", "InternetGateways",
+                           Filters=[{"Name": "attachment.vpc-id", "Values": vpc_ids}])
+        f_sgs  = ex.submit(describe_all, c, "describe_security_groups", "SecurityGroups", Filters=flt)
+        subs, igws, sgs = f_subs.result(), f_igws.result(), f_sgs.result()
+    _group_vpc_blockers(out, subs, igws, sgs)
+    return out
 
-    # Subnets in this VPC
-    subs = c.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]).get("Subnets", [])
+def _group_vpc_blockers(out: dict[str, list[Blocker]], subs: list, igws: list, sgs: list) -> None:
+    """Append each described subnet/IGW/SG to its VPC's blocker list in `out`."""
+    # Subnets in each VPC
     for s in subs:
-        name = next((t["Value"] for t in s.get("Tags", []) if t["Key"] == "Name"), None)
-        blockers.append(Blocker(kind="subnet", id=s["SubnetId"], name=name))
+        out[s["VpcId"]].append(Blocker(kind="subnet", id=s["SubnetId"], name=name_tag(s)))
 
-    # Internet Gateways attached to this VPC
-    igws = c.describe_internet_gateways(
-        Filters=[{"Name": "attachment.vpc-id", "Values": [vpc_id]}]
-    ).get("InternetGateways", [])
+    # Internet Gateways attached to each VPC (attachments ride along so the deleter skips a describe)
     for g in igws:
-        name = next((t["Value"] for t in g.get("Tags", []) if t["Key"] == "Name"), None)
-        blockers.append(Blocker(kind="internet-gateway", id=g["InternetGatewayId"], name=name))
+        attached = [att["VpcId"] for att in g.get("Attachments", []) if att.get("VpcId")]
+        for vpc_id in attached:
+            if vpc_id in out:
+                out[vpc_id].append(Blocker(kind="internet-gateway", id=g["InternetGatewayId"], name=name_tag(g),
+                                           meta={"attached_vpc_ids": attached}))
 
-    # Non-default Security Groups in this VPC (default is deleted with the VPC)
-    sgs = c.describe_security_groups(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]).get("SecurityGroups", [])
+    # Non-default Security Groups (default is deleted with the VPC)
     for sg in sgs:
         if sg.get("GroupName") == "default":
             continue
-        name = next((t["Value"] for t in sg.get("Tags", []) if t["Key"] == "Name"), None)
-        blockers.append(Blocker(kind="security-group", id=sg["GroupId"], name=name))
-    return blockers
+        out[sg["VpcId"]].append(Blocker(kind="security-group", id=sg["GroupId"], name=name_tag(sg)))
+
+# ----- Graph snapshot: describe the whole VPC once, let checkers read from it -----
+# delete() hands it to build_tree(snapshot=...); checkers read it via deps.current_snapshot().
 
-@register_deleter("internet-gateway")
-def _delete_igw(igw_id: str):
-    """Detach IGW from any VPCs then delete."""
+def snapshot_vpc_graph(vpc_id: str) -> dict:
+    """
+    Everything the checkers look at for one VPC, in five concurrent (paginated) describes:
+    subnets, attached IGWs, security groups, NAT gateways and ENIs.
+    """
     c = ec2()
+    flt = [{"Name": "vpc-id", "Values": [vpc_id]}]
+    calls = {
+        "subnets": ("describe_subnets", "Subnets", flt),
+        "igws":    ("describe_internet_gateways", "InternetGateways",
+                    [{"Name": "attachment.vpc-id", "Values": [vpc_id]}]),
+        "sgs":     ("describe_security_groups", "SecurityGroups", flt),
+        "nats":    ("describe_nat_gateways", "NatGateways", flt),
+        "enis":    ("describe_network_interfaces", "NetworkInterfaces", flt),
+    }
+    with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+        futs = {k: ex.submit(describe_all, c, op, key, Filters=f) for k, (op, key, f) in calls.items()}
+    graph = {k: f.result() for k, f in futs.items()}
+    graph["vpc_id"] = vpc_id
+    graph["subnet_ids"] = frozenset(s["SubnetId"] for s in graph["subnets"])
+    return graph
+
+@register_checker("vpc")
+def _check_vpc_blockers(vpc_id: str):
+    """
+    Immediate blockers for a VPC:
+      - subnets
+      - attached internet gateways
+      - NON-DEFAULT security groups
+    Subnet children (e.g., NAT, ENIs) are expanded by their own checkers.
+    """
+    graph = current_snapshot()
+    if graph is not None and graph["vpc_id"] == vpc_id:
+        out: dict[str, list[Blocker]] = {vpc_id: []}
+        _group_vpc_blockers(out, graph["subnets"], graph["igws"], graph["sgs"])
+        return out[vpc_id]
+    # Cheap presence probe first: a VPC deleted out-of-band (or a stale cached id) skips
+    # the three listing describes entirely
     try:
-        igw = c.describe_internet_gateways(InternetGatewayIds=[igw_id])["InternetGateways"][0]
-    except ClientError as e:
-        if e.response["Error"]["Code"] in ("InvalidInternetGatewayID.NotFound",):
-            print(f"[ok] igw {igw_id} already gone")
-            return
-        raise
-
-    for att in igw.get("Attachments", []):
-        vpc_id = att.get("VpcId")
-        if vpc_id:
-            try:
-                print(f"[detach] igw {igw_id} from vpc {vpc_id}")
-                c.detach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
-            except ClientError as e:
-                if e.response["Error"]["Code"] not in ("Gateway.NotAttached", "InvalidInternetGatewayID.NotFound"):
-                    raise
-    print(f"[delete] igw {igw_id}")
-    try:
-        c.delete_internet_gateway(InternetGatewayId=igw_id)
+        ec2().describe_vpcs(VpcIds=[vpc_id])
     except ClientError as e:
-        if e.response["Error"]["Code"] not in ("InvalidInternetGatewayID.NotFound",):
+        if e.response["Error"]["Code"] != "InvalidVpcID.NotFound":
             raise
+        _invalidate_vpc_cache()
+        return []
+    return _check_vpc_blockers_bulk([vpc_id])[vpc_id]
+
+# ENIs in "detaching" release their SG within seconds; retry before giving up (~30s total)
+_SG_IN_USE = ("DependencyViolation", "ResourceInUse")
+_SG_DELETE_ATTEMPTS = 6
 
 @register_deleter("security-group")
-def _delete_sg(sg_id: str):
-    """Delete a non-default SG. Must not be referenced by ENIs."""
+def _delete_sg(sg_id: str, meta: dict | None = None):
+    """Delete a non-default SG. Must not be referenced by ENIs (retries while they detach)."""
     c = ec2()
-    print(f"[delete] security-group {sg_id}")
-    try:
-        c.delete_security_group(GroupId=sg_id)
-    except ClientError as e:
-        code = e.response["Error"]["Code"]
-        if code in ("InvalidGroup.NotFound",):
-            print(f"[ok] security-group {sg_id} already gone")
+    sp_print(f"[delete] security-group {sg_id}")
+    for attempt in range(1, _SG_DELETE_ATTEMPTS + 1):
+        try:
+            c.delete_security_group(GroupId=sg_id)
             return
-        # If it's still attached to some ENI, bubble up so the pipeline errors loudly
-        if code in ("DependencyViolation", "ResourceInUse"):
-            raise SystemExit(f"[abort] security-group {sg_id} is still in use (likely attached to an ENI)")
-        raise
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code in ("InvalidGroup.NotFound",):
+                sp_print(f"[ok] security-group {sg_id} already gone")
+                return
+            if code not in _SG_IN_USE:
+                raise
+        if attempt < _SG_DELETE_ATTEMPTS:
+            sp_print(f"[retry] security-group {sg_id} still in use; attempt {attempt + 1}/{_SG_DELETE_ATTEMPTS}")
+            time.sleep(min(2 ** (attempt - 1), 15))
+    # Still attached to some ENI after the retries: bubble up so the pipeline errors loudly
+    raise SystemExit(f"[abort] security-group {sg_id} is still in use (likely attached to an ENI)")
+
+@register_bulk_deleter("security-group")
+def _delete_sgs_bulk(sg_ids: list[str]) -> None:
+    """
+    Delete several SGs concurrently. A DryRun pass over all of them runs first, so a
+    permission problem aborts before any group is touched (DryRun checks authorization,
+    not dependencies; in-use groups are still handled by _delete_sg's retry).
+    """
+    c = ec2()
+
+    def _dry_run(sg_id: str) -> str | None:
+        try:
+            c.delete_security_group(GroupId=sg_id, DryRun=True)
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code == "DryRunOperation":
+                return sg_id
+            if code in ("InvalidGroup.NotFound",):
+                return None
+            raise
+        return sg_id
+
+    with ThreadPoolExecutor(max_workers=min(8, len(sg_ids)) or 1) as ex:
+        live = [sg_id for sg_id in ex.map(_dry_run, sg_ids) if sg_id]
+        futs = [ex.submit(_delete_sg, sg_id) for sg_id in live]
+    for f in futs:
+        f.result()
 
 @register_deleter("vpc")
-def _delete_vpc(vpc_id: str):
+def _delete_vpc(vpc_id: str, meta: dict | None = None):
     """Delete the VPC itself (assumes blockers have been removed)."""
     c = ec2()
-    print(f"[delete] vpc {vpc_id}")
+    sp_print(f"[delete] vpc {vpc_id}")
     try:
         c.delete_vpc(VpcId=vpc_id)
     except ClientError as e:
@@ -139,7 +250,7 @@ def create() -> str:
     c = ec2()
     vpc_id = find_vpc_id()
     if vpc_id:
-        print(f"[ok] VPC exists: {VPC_NAME} ({VPC_CIDR}) -> {vpc_id}")
+        sp_print(f"[ok] VPC exists: {VPC_NAME} ({VPC_CIDR}) -> {vpc_id}")
         return vpc_id
 
     resp = c.create_vpc(
@@ -150,38 +261,54 @@ def create() -> str:
         }],
     )
     vpc_id = resp["Vpc"]["VpcId"]
-    print(f"[creating] {VPC_NAME} ({VPC_CIDR}) -> {vpc_id}")
+    _invalidate_vpc_cache()
+    sp_print(f"[creating] {VPC_NAME} ({VPC_CIDR}) -> {vpc_id}")
 
-    # sane defaults
-    c.modify_vpc_attribute(VpcId=vpc_id, EnableDnsSupport={"Value": True})
-    c.modify_vpc_attribute(VpcId=vpc_id, EnableDnsHostnames={"Value": True})
+    # sane defaults: two independent attribute writes, sent concurrently (DNS support is
+    # already on for a new VPC, so hostnames doesn't have to wait for it)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futs = [ex.submit(c.modify_vpc_attribute, VpcId=vpc_id, EnableDnsSupport={"Value": True}),
+                ex.submit(c.modify_vpc_attribute, VpcId=vpc_id, EnableDnsHostnames={"Value": True})]
+    for f in futs:
+        f.result()
 
     waiter = c.get_waiter("vpc_available")
     waiter.wait(VpcIds=[vpc_id])
-    print(f"[created] {vpc_id}")
+    sp_print(f"[created] {vpc_id}")
     return vpc_id
 
 def status():
     c = ec2()
     vpc_id = find_vpc_id()
     if not vpc_id:
-        print(f"[status] {VPC_NAME} ({VPC_CIDR}): NOT FOUND")
+        sp_print(f"[status] {VPC_NAME} ({VPC_CIDR}): NOT FOUND")
         return
     v = c.describe_vpcs(VpcIds=[vpc_id])["Vpcs"][0]
     tags = {t["Key"]: t["Value"] for t in v.get("Tags", [])}
-    print(f"[status] FOUND -> {vpc_id}")
-    print(f"  State={v['State']}  IsDefault={v['IsDefault']}  Tenancy={v['InstanceTenancy']}")
-    print(f"  CIDR={v['CidrBlock']}  Tags={tags}")
+    sp_print(f"[status] FOUND -> {vpc_id}")
+    sp_print(f"  State={v['State']}  IsDefault={v['IsDefault']}  Tenancy={v['InstanceTenancy']}")
+    sp_print(f"  CIDR={v['CidrBlock']}  Tags={tags}")
 
 def delete():
     """Delete the VPC and all its discovered children immediately (no extra prompts)."""
     vpc_id = find_vpc_id()
     if not vpc_id:
-        print(f"[ok] nothing to delete: {VPC_NAME} ({VPC_CIDR}) not found")
+        sp_print(f"[ok] nothing to delete: {VPC_NAME} ({VPC_CIDR}) not found")
         return
-    root = build_tree(kind="vpc", rid=vpc_id, name=VPC_NAME, reason="has dependent resources (if any)")
+    # One snapshot of the VPC feeds every checker in the tree (no per-subnet describes)
+    root = build_tree(kind="vpc", rid=vpc_id, name=VPC_NAME, reason="has dependent resources (if any)",
+                      snapshot=snapshot_vpc_graph(vpc_id))
     prompt_and_delete(root, delete_root=True)  # no prompt inside deps.py
-    print(f"[deleted-requested] {vpc_id}")
+    _invalidate_vpc_cache()
+    sp_print(f"[deleted-requested] {vpc_id}")
+
+async def adelete() -> None:
+    """
+    delete() for callers already running an event loop: the whole blocking pipeline runs on a
+    worker thread, so the loop keeps serving other tasks. (Not an aioboto3 port: its describes
+    and deletes already overlap on thread pools over the one pooled boto3 client.)
+    """
+    await asyncio.to_thread(delete)
 
 def main():
     ap = argparse.ArgumentParser(description="Create/Status/Delete the mar5-demo VPC (using your naming).")
@@ -0,0 +1,111 @@
+# tests/test_deps.py
+# deps._layers on stub trees (no AWS): run with `python -m unittest` from the repo root.
+
+import contextlib
+import io
+import unittest
+
+from infra_cc import deps
+from infra_cc.deps import Blocker, DELETE_ORDER, _layers, _postorder
+
+_STAGE = {kind: i for i, kinds in enumerate(DELETE_ORDER) for kind in kinds}
+
+
+def _b(kind, rid, *children):
+    return Blocker(kind=kind, id=rid, children=list(children))
+
+
+class LayersTest(unittest.TestCase):
+    def _where(self, layers):
+        """(kind, id) -> layer index; also checks nothing is placed twice."""
+        where = {}
+        for i, layer in enumerate(layers):
+            for n in layer:
+                self.assertNotIn((n.kind, n.id), where)
+                where[(n.kind, n.id)] = i
+        return where
+
+    def _assert_valid(self, root, layers):
+        where = self._where(layers)
+        nodes = _postorder(root)
+        self.assertEqual(set(where), {(n.kind, n.id) for n in nodes})
+        for n in nodes:
+            for ch in n.children:  # children always go first
+                self.assertLess(where[(ch.kind, ch.id)], where[(n.kind, n.id)])
+        for a in nodes:  # known kinds stay behind every node of an earlier stage
+            for b in nodes:
+                if a.kind in _STAGE and b.kind in _STAGE and _STAGE[a.kind] < _STAGE[b.kind]:
+                    self.assertLess(where[(a.kind, a.id)], where[(b.kind, b.id)])
+        return where
+
+    def test_known_kinds_use_the_static_stages(self):
+        root = _b("vpc", "vpc-1",
+                  _b("subnet", "sub-1", _b("nat-gateway", "nat-1"), _b("eni", "eni-1")),
+                  _b("internet-gateway", "igw-1"),
+                  _b("security-group", "sg-1"))
+        layers = _layers([root])
+        self.assertEqual([sorted(n.kind for n in layer) for layer in layers], [
+            ["eni", "nat-gateway"],
+            ["internet-gateway", "security-group", "subnet"],
+            ["vpc"],
+        ])
+
+    def test_mixed_known_and_unknown_kinds(self):
+        # The IGW sits under an unknown-kind wrapper, so only the stage floor keeps it behind
+        # the NAT; the deep unknown chain under sub-2 pushes that subnet (and so every
+        # stage-1 floor) up a few layers. The shared ENI is reached through two parents.
+        shared_eni = _b("eni", "eni-shared")
+        root = _b("vpc", "vpc-1",
+                  _b("wrapper", "w-1", _b("internet-gateway", "igw-1")),
+                  _b("subnet", "sub-1", _b("nat-gateway", "nat-1"), shared_eni),
+                  _b("subnet", "sub-2", _b("x", "x-1", _b("y", "y-1", _b("z", "z-1"))), shared_eni),
+                  _b("security-group", "sg-1", _b("eni", "eni-shared")))
+        where = self._assert_valid(root, _layers([root]))
+        self.assertEqual(where[("nat-gateway", "nat-1")], 0)
+        self.assertEqual(where[("z", "z-1")], 0)
+        self.assertEqual(where[("subnet", "sub-2")], 3)
+        self.assertGreater(where[("internet-gateway", "igw-1")], where[("nat-gateway", "nat-1")])
+        self.assertGreater(where[("vpc", "vpc-1")], where[("subnet", "sub-2")])
+
+    def test_earlier_stage_reached_late_still_lifts_later_stages(self):
+        # The NAT is deep under unknown kinds and only reached after the SG in traversal order
+        root = _b("vpc", "vpc-1",
+                  _b("security-group", "sg-1"),
+                  _b("a", "a-1", _b("b", "b-1", _b("c", "c-1", _b("nat-gateway", "nat-1", _b("d", "d-1"))))))
+        where = self._assert_valid(root, _layers([root]))
+        self.assertGreater(where[("security-group", "sg-1")], where[("nat-gateway", "nat-1")])
+
+    def test_unknown_leaf_root(self):
+        self.assertEqual([[n.id for n in layer] for layer in _layers([_b("thing", "t-1")])], [["t-1"]])
+
+
+class PromptAndDeleteTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        saved = dict(deps._DELETERS), dict(deps._BULK_DELETERS)
+        self.addCleanup(self._restore, *saved)
+        deps._BULK_DELETERS.clear()
+        for kind in ("nat-gateway", "internet-gateway", "eni", "security-group", "subnet"):
+            deps._DELETERS[kind] = lambda rid, meta, kind=kind: self.calls.append(kind)
+
+    @staticmethod
+    def _restore(deleters, bulk):
+        deps._DELETERS.clear()
+        deps._DELETERS.update(deleters)
+        deps._BULK_DELETERS.clear()
+        deps._BULK_DELETERS.update(bulk)
+
+    def test_keep_root_still_orders_across_siblings(self):
+        # The root kind has no deleter and is kept; NAT/ENI must still go before IGW/SG
+        root = _b("keep", "k-1",
+                  _b("internet-gateway", "igw-1"),
+                  _b("security-group", "sg-1"),
+                  _b("subnet", "sub-1", _b("nat-gateway", "nat-1"), _b("eni", "eni-1")))
+        with contextlib.redirect_stdout(io.StringIO()):  # the printed tree
+            deps.prompt_and_delete(root, delete_root=False)
+        self.assertEqual(sorted(self.calls[:2]), ["eni", "nat-gateway"])
+        self.assertEqual(sorted(self.calls[2:]), ["internet-gateway", "security-group", "subnet"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# tests/test_vpc.py
+# vpc.adelete() under a running event loop: run with `python -m unittest` from the repo root.
+# infra_cc.vpc imports botocore, so these are skipped where boto3 isn't installed.
+
+import asyncio
+import importlib.util
+import threading
+import unittest
+from unittest import mock
+
+
+@unittest.skipUnless(importlib.util.find_spec("boto3"), "boto3 not installed")
+class ADeleteTest(unittest.TestCase):
+    def test_adelete_runs_delete_off_the_loop(self):
+        from infra_cc import vpc
+
+        seen = []
+
+        def fake_delete():
+            seen.append(threading.current_thread())
+
+        async def main():
+            ticks = 0
+
+            async def ticker():  # the loop keeps running while delete() does
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            t = asyncio.create_task(ticker())
+            await vpc.adelete()
+            t.cancel()
+            return ticks
+
+        with mock.patch.object(vpc, "delete", fake_delete):
+            ticks = asyncio.run(main())
+        self.assertEqual(len(seen), 1)
+        self.assertIsNot(seen[0], threading.main_thread())
+        self.assertGreater(ticks, 0)
+
+    def test_adelete_propagates_errors(self):
+        from infra_cc import vpc
+
+        def boom():
+            raise SystemExit("[abort] boom")
+
+        with mock.patch.object(vpc, "delete", boom):
+            with self.assertRaises(SystemExit):
+                asyncio.run(vpc.adelete())
+
+
+if __name__ == "__main__":
+    unittest.main()